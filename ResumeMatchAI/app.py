@@ -1,16 +1,18 @@
+import hashlib
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import StringIO
-import time
-from typing import List, Dict, Tuple, Optional
+from typing import List, Tuple, Optional
 
 # Import utility modules
 from utils.text_extractor import extract_text_from_file
 from utils.similarity_analyzer import SimilarityAnalyzer
 from utils.skill_extractor import SkillExtractor
 from utils.visualizations import create_match_chart, create_skills_radar_chart, create_comparison_chart
-from utils.improvement_suggestions import generate_improvement_suggestions
+from utils.improvement_suggestions import Suggestions, generate_improvement_suggestions
 
 # Page configuration
 st.set_page_config(
@@ -20,19 +22,27 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize session state
-if 'analyzer' not in st.session_state:
-    st.session_state.analyzer = SimilarityAnalyzer()
-    
-if 'skill_extractor' not in st.session_state:
-    st.session_state.skill_extractor = SkillExtractor()
+# Heavy model objects are cached per process and shared across sessions
+@st.cache_resource
+def get_analyzer() -> SimilarityAnalyzer:
+    return SimilarityAnalyzer()
+
+@st.cache_resource
+def get_skill_extractor() -> SkillExtractor:
+    return SkillExtractor()
 
+# Initialize session state
 if 'uploaded_resumes' not in st.session_state:
     st.session_state.uploaded_resumes = []
 
 if 'analysis_results' not in st.session_state:
     st.session_state.analysis_results = []
 
+if 'resume_text_cache' not in st.session_state:
+    # Extracted text keyed by file-content hash, so incremental uploads
+    # only pay extraction cost for files not seen earlier in the session
+    st.session_state.resume_text_cache = {}
+
 def main():
     st.title("🎯 Resume Matcher")
     st.markdown("**Analyze semantic similarity between resumes and job descriptions using advanced NLP**")
@@ -107,15 +117,18 @@ def analyze_single_resume(resume_text: str, job_description: str, filename: str)
         status_text.text("Computing semantic similarity...")
         progress_bar.progress(25)
         
-        similarity_score = st.session_state.analyzer.compute_similarity(resume_text, job_description)
+        similarity_score = get_analyzer().compute_similarity(resume_text, job_description)
         
         # Step 2: Extract skills
         status_text.text("Extracting and matching skills...")
         progress_bar.progress(50)
         
-        resume_skills = st.session_state.skill_extractor.extract_skills(resume_text)
-        job_skills = st.session_state.skill_extractor.extract_skills(job_description)
-        matched_skills, missing_skills = st.session_state.skill_extractor.compare_skills(resume_skills, job_skills)
+        # Both documents go through one batched call so the spaCy
+        # pipeline processes them in a single pipe pass
+        resume_skills, job_skills = get_skill_extractor().extract_skills_batch(
+            [resume_text, job_description]
+        )
+        matched_skills, missing_skills = get_skill_extractor().compare_skills(resume_skills, job_skills)
         
         # Step 3: Generate suggestions
         status_text.text("Generating improvement suggestions...")
@@ -126,8 +139,7 @@ def analyze_single_resume(resume_text: str, job_description: str, filename: str)
         # Step 4: Complete
         status_text.text("Analysis complete!")
         progress_bar.progress(100)
-        time.sleep(0.5)
-        
+
         # Clear progress indicators
         progress_bar.empty()
         status_text.empty()
@@ -145,7 +157,7 @@ def analyze_single_resume(resume_text: str, job_description: str, filename: str)
 
 def display_analysis_results(filename: str, similarity_score: float, matched_skills: List[str], 
                            missing_skills: List[str], resume_skills: List[str], 
-                           job_skills: List[str], suggestions: Dict[str, List[str]]):
+                           job_skills: List[str], suggestions: Suggestions):
     """Display comprehensive analysis results"""
     
     st.markdown("---")
@@ -156,7 +168,10 @@ def display_analysis_results(filename: str, similarity_score: float, matched_ski
     
     with col1:
         st.metric("Overall Match Score", f"{similarity_score:.1f}%")
-        st.plotly_chart(create_match_chart(similarity_score), use_container_width=True)
+        # Stable element key lets Streamlit patch the existing chart in
+        # place instead of tearing down and rebuilding the DOM node
+        st.plotly_chart(create_match_chart(similarity_score),
+                        use_container_width=True, key="match_gauge")
     
     with col2:
         st.metric("Matched Skills", len(matched_skills))
@@ -172,16 +187,15 @@ def display_analysis_results(filename: str, similarity_score: float, matched_ski
     with col1:
         st.subheader("✅ Matched Skills")
         if matched_skills:
-            for skill in matched_skills:
-                st.success(f"• {skill}")
+            # One markdown widget instead of one widget per skill
+            st.markdown("\n".join(f"- ✅ `{skill}`" for skill in matched_skills))
         else:
             st.info("No directly matched skills found.")
-    
+
     with col2:
         st.subheader("❌ Missing Skills")
         if missing_skills:
-            for skill in missing_skills:
-                st.error(f"• {skill}")
+            st.markdown("\n".join(f"- ❌ `{skill}`" for skill in missing_skills))
         else:
             st.success("All required skills are present!")
     
@@ -189,7 +203,8 @@ def display_analysis_results(filename: str, similarity_score: float, matched_ski
     if resume_skills and job_skills:
         st.subheader("📈 Skills Coverage Analysis")
         skills_chart = create_skills_radar_chart(resume_skills, job_skills, matched_skills)
-        st.plotly_chart(skills_chart, use_container_width=True)
+        st.plotly_chart(skills_chart, use_container_width=True,
+                        key="skills_radar")
     
     # Improvement suggestions
     if suggestions:
@@ -237,26 +252,68 @@ def compare_multiple_resumes(uploaded_files, job_description: str):
     status_text = st.empty()
     
     total_files = len(uploaded_files)
-    
-    for i, uploaded_file in enumerate(uploaded_files):
-        status_text.text(f"Processing {uploaded_file.name}...")
-        progress_bar.progress((i + 1) / total_files)
-        
-        try:
-            # Extract text
-            resume_text = extract_text_from_file(uploaded_file)
-            if not resume_text:
-                st.warning(f"⚠️ Could not extract text from {uploaded_file.name}")
-                continue
-            
-            # Analyze
-            similarity_score = st.session_state.analyzer.compute_similarity(resume_text, job_description)
-            resume_skills = st.session_state.skill_extractor.extract_skills(resume_text)
-            job_skills = st.session_state.skill_extractor.extract_skills(job_description)
-            matched_skills, missing_skills = st.session_state.skill_extractor.compare_skills(resume_skills, job_skills)
-            
+
+    # Step 1: Extract text from files not already in the session cache, in
+    # parallel; PyMuPDF releases the GIL while parsing, so threads give
+    # real concurrency here
+    text_cache = st.session_state.resume_text_cache
+    file_keys = [
+        hashlib.blake2b(uploaded_file.getvalue(), digest_size=16).hexdigest()
+        for uploaded_file in uploaded_files
+    ]
+    new_items = [
+        (key, uploaded_file)
+        for key, uploaded_file in zip(file_keys, uploaded_files)
+        if key not in text_cache
+    ]
+
+    if new_items:
+        status_text.text(f"Extracting text from {len(new_items)} new file(s)...")
+        max_workers = min(8, os.cpu_count() or 1, len(new_items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(extract_text_from_file, uploaded_file): key
+                for key, uploaded_file in new_items
+            }
+            # Consume extractions as they finish so progress keeps moving
+            # while the remaining files are still being parsed
+            for done, future in enumerate(as_completed(futures), start=1):
+                text_cache[futures[future]] = future.result()
+                progress_bar.progress(0.5 * done / len(new_items))
+    progress_bar.progress(0.5)
+
+    extracted = []
+    for uploaded_file, key in zip(uploaded_files, file_keys):
+        resume_text = text_cache.get(key)
+        if not resume_text:
+            st.warning(f"⚠️ Could not extract text from {uploaded_file.name}")
+            continue
+
+        extracted.append((uploaded_file.name, resume_text))
+
+    # Step 2: Compute all similarity scores in a single batched call
+    if extracted:
+        status_text.text("Computing similarity scores...")
+        resume_texts = [resume_text for _, resume_text in extracted]
+
+        # Duplicate uploads (same content, different filename) are scored once
+        unique_texts = list(dict.fromkeys(resume_texts))
+        unique_scores = get_analyzer().compute_similarity_batch(unique_texts, job_description)
+        score_by_text = dict(zip(unique_texts, unique_scores))
+        similarity_scores = [score_by_text[resume_text] for resume_text in resume_texts]
+
+        # Step 3: Extract skills for the job description and all resumes in
+        # one batched pass, then compare per resume
+        status_text.text("Extracting skills...")
+        all_skills = get_skill_extractor().extract_skills_batch([job_description] + resume_texts)
+        job_skills, resume_skills_lists = all_skills[0], all_skills[1:]
+
+        for (filename, resume_text), similarity_score, resume_skills in zip(
+                extracted, similarity_scores, resume_skills_lists):
+            matched_skills, missing_skills = get_skill_extractor().compare_skills(resume_skills, job_skills)
+
             results.append({
-                'filename': uploaded_file.name,
+                'filename': filename,
                 'similarity_score': similarity_score,
                 'matched_skills': len(matched_skills),
                 'missing_skills': len(missing_skills),
@@ -264,54 +321,66 @@ def compare_multiple_resumes(uploaded_files, job_description: str):
                 'matched_skills_list': matched_skills,
                 'missing_skills_list': missing_skills
             })
-            
-        except Exception as e:
-            st.error(f"❌ Error processing {uploaded_file.name}: {str(e)}")
-    
+
+        progress_bar.progress(1.0)
+
     progress_bar.empty()
     status_text.empty()
     
     if results:
         st.session_state.analysis_results = results
         st.success(f"✅ Successfully analyzed {len(results)} resumes!")
-        st.rerun()
 
+@st.fragment
 def display_comparison_results():
     """Display comparison results for multiple resumes"""
     results = st.session_state.analysis_results
-    
+    if not results:
+        return
+
+    # O(1) lookup for the per-resume detail view below
+    results_by_name = {result['filename']: result for result in results}
+
     st.markdown("---")
     st.header("📊 Comparison Results")
     
-    # Create dataframe for display
+    # Create dataframe for display; sort and reduce on the raw score array
     df = pd.DataFrame(results)
-    df = df.sort_values('similarity_score', ascending=False)
-    
+    scores = df['similarity_score'].to_numpy()
+    df = df.iloc[np.argsort(-scores)]
+
     # Summary metrics
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Total Resumes", len(df))
     with col2:
-        st.metric("Best Match", f"{df['similarity_score'].max():.1f}%")
+        st.metric("Best Match", f"{scores.max():.1f}%")
     with col3:
-        st.metric("Average Match", f"{df['similarity_score'].mean():.1f}%")
+        st.metric("Average Match", f"{scores.mean():.1f}%")
     with col4:
-        st.metric("Lowest Match", f"{df['similarity_score'].min():.1f}%")
+        st.metric("Lowest Match", f"{scores.min():.1f}%")
     
     # Comparison chart
     st.subheader("📈 Resume Comparison Chart")
     comparison_chart = create_comparison_chart(df)
-    st.plotly_chart(comparison_chart, use_container_width=True)
+    st.plotly_chart(comparison_chart, use_container_width=True,
+                    key="comparison_chart")
     
     # Detailed results table
     st.subheader("📋 Detailed Results")
     
-    # Format the dataframe for display
-    display_df = df[['filename', 'similarity_score', 'matched_skills', 'missing_skills', 'total_skills']].copy()
-    display_df.columns = ['Resume File', 'Match Score (%)', 'Matched Skills', 'Missing Skills', 'Total Skills']
-    display_df['Match Score (%)'] = display_df['Match Score (%)'].round(1)
-    
-    st.dataframe(display_df, use_container_width=True)
+    # Relabel and format through column_config instead of copying the frame
+    st.dataframe(
+        df[['filename', 'similarity_score', 'matched_skills', 'missing_skills', 'total_skills']],
+        column_config={
+            'filename': st.column_config.TextColumn("Resume File"),
+            'similarity_score': st.column_config.NumberColumn("Match Score (%)", format="%.1f"),
+            'matched_skills': st.column_config.NumberColumn("Matched Skills"),
+            'missing_skills': st.column_config.NumberColumn("Missing Skills"),
+            'total_skills': st.column_config.NumberColumn("Total Skills"),
+        },
+        use_container_width=True
+    )
     
     # Individual resume details
     st.subheader("🔍 Individual Resume Analysis")
@@ -323,24 +392,22 @@ def display_comparison_results():
     )
     
     if selected_resume:
-        resume_data = df[df['filename'] == selected_resume].iloc[0]
+        resume_data = results_by_name[selected_resume]
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.write("**✅ Matched Skills:**")
-            for skill in resume_data['matched_skills_list']:
-                st.success(f"• {skill}")
-        
+            st.markdown("\n".join(f"- ✅ `{skill}`" for skill in resume_data['matched_skills_list']))
+
         with col2:
             st.write("**❌ Missing Skills:**")
-            for skill in resume_data['missing_skills_list']:
-                st.error(f"• {skill}")
+            st.markdown("\n".join(f"- ❌ `{skill}`" for skill in resume_data['missing_skills_list']))
     
-    # Clear results button
+    # Clear results button; only the fragment needs to rerun
     if st.button("🗑️ Clear Results"):
         st.session_state.analysis_results = []
-        st.rerun()
+        st.rerun(scope="fragment")
 
 def show_about():
     """Display information about the application"""
@@ -1,9 +1,154 @@
-import re
-from typing import List, Dict, Tuple
+import functools
+# Prefer google-re2 when available: it guarantees linear-time matching
+# for the alternation-heavy patterns below. The stdlib engine is a
+# drop-in fallback for the subset of syntax used here.
+try:
+    import re2 as re
+except ImportError:
+    import re
+import numpy as np
+from dataclasses import dataclass
+from typing import FrozenSet, List, Dict, Tuple
 import random
 
+# Patterns are compiled once at import; compiling inside the helpers would
+# re-parse them on every suggestion run
+_NUMBERS_RE = re.compile(r'\d+\.?\d*%?|\b\d+\b')
+_WORD_RE = re.compile(r'\S+')
+_BULLET_RE = re.compile(r'^[\s\t]*[-*•]', re.MULTILINE)
+_SPLIT_RE = re.compile(r'[,;|&\n]+')
+_DIGIT_RE = re.compile(r'\d+')
+# All requirement lead-ins share the same tail, so one alternation finds
+# every requirement clause in a single pass over the job description
+_REQUIREMENT_RE = re.compile(
+    r'(?:required?|must\s+have|essential|qualifications?|responsibilities?)'
+    r'\s*:?\s*([^.;]+)',
+    re.IGNORECASE
+)
+_TECH_CAT_RE = re.compile(r'\b(?:python|java|sql|javascript|programming)\b')
+_TOOLS_CAT_RE = re.compile(r'\b(?:git|docker|kubernetes|aws|azure)\b')
+_SOFT_CAT_RE = re.compile(r'\b(?:communication|leadership|teamwork|management)\b')
+# Single-character bullet markers; isdisjoint short-circuits on first hit
+_BULLET_CHARS = frozenset('•*-▪')
+_HIGH_PRIORITY_SKILLS = ('python', 'sql', 'machine learning', 'aws', 'react', 'java')
+# Industry-specific terms, grouped by industry: finance, healthcare,
+# ecommerce, saas, gaming, ai/ml
+_INDUSTRY_TERMS = (
+    'financial', 'banking', 'trading', 'investment', 'fintech',
+    'healthcare', 'medical', 'patient', 'clinical', 'pharma',
+    'ecommerce', 'retail', 'marketplace', 'customer', 'sales',
+    'saas', 'subscription', 'platform', 'cloud', 'enterprise',
+    'gaming', 'game', 'unity', 'unreal', 'mobile games',
+    'ai', 'machine learning', 'deep learning', 'neural', 'nlp',
+)
+# Longest terms first so multi-word terms win over their prefixes
+_INDUSTRY_RE = re.compile('|'.join(
+    re.escape(term) for term in sorted(_INDUSTRY_TERMS, key=len, reverse=True)
+))
+# Common technical terms looked up directly in the job description
+_COMMON_TECH_TERMS = frozenset((
+    'python', 'java', 'javascript', 'react', 'angular', 'vue',
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes',
+    'git', 'linux', 'agile', 'scrum', 'ci/cd',
+))
+# Acronyms, JavaScript frameworks, database variants and hyphenated terms
+# folded into one alternation so keyword extraction scans the text once
+_TECH_RE = re.compile(r'\b[A-Z]{2,}\b|\b\w+\.js\b|\b\w+SQL\b|\b\w+-\w+\b')
+# Weak verbs commonly found in resumes mapped to stronger alternatives
+_SYNONYM_MAP = {
+    'developed': ['built', 'created', 'designed', 'implemented'],
+    'managed': ['led', 'supervised', 'oversaw', 'directed'],
+    'improved': ['enhanced', 'optimized', 'upgraded', 'refined'],
+    'worked': ['collaborated', 'partnered', 'contributed', 'participated'],
+    'used': ['utilized', 'employed', 'leveraged', 'applied'],
+}
+# One scan of the resume for base words, one scan of the job description
+# for synonyms, then an inverted-map lookup joins the two
+_BASE_WORD_RE = re.compile('|'.join(_SYNONYM_MAP))
+_SYN_TO_BASE = {
+    syn: base for base, syns in _SYNONYM_MAP.items() for syn in syns
+}
+_SYNONYM_RE = re.compile('|'.join(_SYN_TO_BASE))
+
+# Display category names mapped to the Suggestions attribute backing them
+_CATEGORY_ATTRS = {
+    "Missing Skills": "missing_skills_suggestions",
+    "Content Enhancement": "content_enhancement",
+    "Keyword Optimization": "keyword_optimization",
+    "Structure Improvements": "structure_improvements",
+    "Action Items": "action_items",
+}
+
+
+@dataclass
+class Suggestions:
+    """
+    Improvement suggestions computed lazily, one category at a time.
+
+    Each category is generated on first access and cached, so rendering a
+    subset of categories skips the analysis work for the rest. Supports
+    the mapping-style access the UI uses: iteration, items(), indexing by
+    category name and len().
+    """
+
+    resume_text: str
+    job_description: str
+    missing_skills: List[str]
+
+    @functools.cached_property
+    def _resume_lower(self) -> str:
+        return self.resume_text.lower()
+
+    @functools.cached_property
+    def _resume_tokens(self) -> set:
+        return set(self._resume_lower.split())
+
+    @functools.cached_property
+    def missing_skills_suggestions(self) -> List[str]:
+        return generate_missing_skills_suggestions(self.missing_skills)
+
+    @functools.cached_property
+    def content_enhancement(self) -> List[str]:
+        return generate_content_suggestions(
+            self.resume_text, self.job_description,
+            self._resume_lower, self._resume_tokens)
+
+    @functools.cached_property
+    def keyword_optimization(self) -> List[str]:
+        return generate_keyword_suggestions(
+            self.resume_text, self.job_description,
+            self._resume_lower, self._resume_tokens)
+
+    @functools.cached_property
+    def structure_improvements(self) -> List[str]:
+        return generate_structure_suggestions(self.resume_text, self._resume_lower)
+
+    @functools.cached_property
+    def action_items(self) -> List[str]:
+        return generate_action_items(
+            self.missing_skills, self.resume_text, self._resume_lower)
+
+    def __getitem__(self, category: str) -> List[str]:
+        return getattr(self, _CATEGORY_ATTRS[category])
+
+    def __iter__(self):
+        return iter(_CATEGORY_ATTRS)
+
+    def __len__(self) -> int:
+        return len(_CATEGORY_ATTRS)
+
+    def keys(self):
+        return _CATEGORY_ATTRS.keys()
+
+    def items(self):
+        """Yield (category, suggestions) pairs, computing each on demand."""
+        for category, attr in _CATEGORY_ATTRS.items():
+            yield category, getattr(self, attr)
+
+
 def generate_improvement_suggestions(resume_text: str, job_description: str, 
-                                   missing_skills: List[str]) -> Dict[str, List[str]]:
+                                   missing_skills: List[str]) -> Suggestions:
     """
     Generate comprehensive improvement suggestions for the resume.
     
@@ -13,32 +158,10 @@ def generate_improvement_suggestions(resume_text: str, job_description: str,
         missing_skills: List of skills missing from the resume
         
     Returns:
-        Dictionary categorizing different types of suggestions
+        Suggestions object mapping category names to suggestion lists,
+        computing each category lazily on first access
     """
-    suggestions = {
-        "Missing Skills": [],
-        "Content Enhancement": [],
-        "Keyword Optimization": [],
-        "Structure Improvements": [],
-        "Action Items": []
-    }
-    
-    # Generate missing skills suggestions
-    suggestions["Missing Skills"] = generate_missing_skills_suggestions(missing_skills)
-    
-    # Generate content enhancement suggestions
-    suggestions["Content Enhancement"] = generate_content_suggestions(resume_text, job_description)
-    
-    # Generate keyword optimization suggestions
-    suggestions["Keyword Optimization"] = generate_keyword_suggestions(resume_text, job_description)
-    
-    # Generate structure improvement suggestions
-    suggestions["Structure Improvements"] = generate_structure_suggestions(resume_text)
-    
-    # Generate actionable items
-    suggestions["Action Items"] = generate_action_items(missing_skills, resume_text)
-    
-    return suggestions
+    return Suggestions(resume_text, job_description, missing_skills)
 
 def generate_missing_skills_suggestions(missing_skills: List[str]) -> List[str]:
     """Generate suggestions for missing skills."""
@@ -55,11 +178,11 @@ def generate_missing_skills_suggestions(missing_skills: List[str]) -> List[str]:
     
     for skill in missing_skills:
         skill_lower = skill.lower()
-        if any(tech in skill_lower for tech in ['python', 'java', 'sql', 'javascript', 'programming']):
+        if _TECH_CAT_RE.search(skill_lower):
             technical_skills.append(skill)
-        elif any(tool in skill_lower for tool in ['git', 'docker', 'kubernetes', 'aws', 'azure']):
+        elif _TOOLS_CAT_RE.search(skill_lower):
             tools_platforms.append(skill)
-        elif any(soft in skill_lower for soft in ['communication', 'leadership', 'teamwork', 'management']):
+        elif _SOFT_CAT_RE.search(skill_lower):
             soft_skills.append(skill)
         else:
             technical_skills.append(skill)  # Default to technical
@@ -77,30 +200,44 @@ def generate_missing_skills_suggestions(missing_skills: List[str]) -> List[str]:
         suggestions.append(f"Emphasize these soft skills with specific examples: {', '.join(soft_skills[:3])}")
         suggestions.append("Use quantifiable achievements to demonstrate these capabilities")
     
-    # Priority recommendations
-    high_priority = ['python', 'sql', 'machine learning', 'aws', 'react', 'java']
-    priority_missing = [skill for skill in missing_skills if any(hp in skill.lower() for hp in high_priority)]
-    
+    # Priority recommendations: one vectorized substring search per
+    # priority term instead of a nested Python loop over every skill
+    skills_arr = np.char.lower(np.asarray(missing_skills, dtype=str))
+    mask = np.zeros(len(skills_arr), dtype=bool)
+    for term in _HIGH_PRIORITY_SKILLS:
+        mask |= np.char.find(skills_arr, term) >= 0
+    priority_missing = [skill for skill, hit in zip(missing_skills, mask) if hit]
+
     if priority_missing:
         suggestions.append(f"High priority skills to develop: {', '.join(priority_missing[:3])}")
     
     return suggestions
 
-def generate_content_suggestions(resume_text: str, job_description: str) -> List[str]:
+def generate_content_suggestions(resume_text: str, job_description: str,
+                                 resume_lower: str = None, resume_tokens: set = None) -> List[str]:
     """Generate content enhancement suggestions."""
     suggestions = []
-    
-    # Analyze resume length
-    word_count = len(resume_text.split())
+
+    if resume_lower is None:
+        resume_lower = resume_text.lower()
+    if resume_tokens is None:
+        resume_tokens = set(resume_lower.split())
+
+    # Analyze resume length without materializing the word list
+    word_count = sum(1 for _ in _WORD_RE.finditer(resume_text))
     if word_count < 200:
         suggestions.append("Your resume appears brief. Consider adding more details about your experience and achievements.")
     elif word_count > 800:
         suggestions.append("Your resume is quite lengthy. Consider condensing to focus on most relevant experience.")
     
-    # Check for quantifiable achievements
-    numbers_pattern = r'\d+\.?\d*%?|\b\d+\b'
-    numbers_found = len(re.findall(numbers_pattern, resume_text))
-    
+    # Check for quantifiable achievements; only the "fewer than 3"
+    # threshold matters, so stop scanning once the third number is found
+    numbers_found = 0
+    for _ in _NUMBERS_RE.finditer(resume_text):
+        numbers_found += 1
+        if numbers_found >= 3:
+            break
+
     if numbers_found < 3:
         suggestions.append("Add quantifiable achievements (e.g., 'Increased efficiency by 25%', 'Managed team of 5')")
     
@@ -108,16 +245,20 @@ def generate_content_suggestions(resume_text: str, job_description: str) -> List
     action_verbs = ['developed', 'implemented', 'managed', 'led', 'created', 'designed', 
                    'optimized', 'achieved', 'delivered', 'improved', 'built', 'analyzed']
     
-    action_verb_count = sum(1 for verb in action_verbs if verb in resume_text.lower())
-    
+    action_verb_count = 0
+    for verb in action_verbs:
+        if verb in resume_tokens:
+            action_verb_count += 1
+            if action_verb_count >= 5:
+                break
+
     if action_verb_count < 5:
         suggestions.append("Use more strong action verbs to describe your accomplishments")
         suggestions.append("Start bullet points with impactful verbs like 'Developed', 'Implemented', 'Led'")
     
     # Analyze job description for key requirements
     job_keywords = extract_key_requirements(job_description)
-    resume_lower = resume_text.lower()
-    
+
     missing_context = []
     for keyword in job_keywords[:5]:  # Check top 5 keywords
         if keyword.lower() not in resume_lower:
@@ -135,24 +276,34 @@ def generate_content_suggestions(resume_text: str, job_description: str) -> List
     
     return suggestions
 
-def generate_keyword_suggestions(resume_text: str, job_description: str) -> List[str]:
+def generate_keyword_suggestions(resume_text: str, job_description: str,
+                                 resume_lower: str = None,
+                                 resume_tokens: set = None) -> List[str]:
     """Generate keyword optimization suggestions."""
     suggestions = []
-    
-    # Extract important keywords from job description
+
+    if resume_lower is None:
+        resume_lower = resume_text.lower()
+    if resume_tokens is None:
+        resume_tokens = set(resume_lower.split())
+
+    # Extract important keywords from job description (already lowercased)
     job_keywords = extract_keywords_from_job(job_description)
-    resume_lower = resume_text.lower()
-    
-    # Find missing important keywords
-    missing_keywords = [kw for kw in job_keywords if kw.lower() not in resume_lower]
-    
+
+    # Cheap set probe first; fall back to a substring check only on a miss
+    # so keywords glued to punctuation in the resume still count as present
+    present_keywords = {
+        kw for kw in job_keywords if kw in resume_tokens or kw in resume_lower
+    }
+    missing_keywords = sorted(job_keywords - present_keywords)
+
     if missing_keywords:
         suggestions.append(f"Consider incorporating these keywords: {', '.join(missing_keywords[:8])}")
         suggestions.append("Naturally integrate keywords into your experience descriptions")
     
-    # Check keyword density
-    total_words = len(resume_text.split())
-    keyword_density = len([kw for kw in job_keywords if kw.lower() in resume_lower]) / total_words * 100
+    # Check keyword density without materializing the word list
+    total_words = sum(1 for _ in _WORD_RE.finditer(resume_text))
+    keyword_density = len(present_keywords) / total_words * 100
     
     if keyword_density < 2:
         suggestions.append("Increase relevant keyword density while maintaining natural flow")
@@ -160,16 +311,19 @@ def generate_keyword_suggestions(resume_text: str, job_description: str) -> List
         suggestions.append("Reduce keyword stuffing - focus on natural integration")
     
     # Synonym suggestions
-    synonym_suggestions = generate_synonym_suggestions(resume_text, job_description)
+    synonym_suggestions = generate_synonym_suggestions(resume_text, job_description, resume_lower)
     if synonym_suggestions:
         suggestions.extend(synonym_suggestions)
     
     return suggestions
 
-def generate_structure_suggestions(resume_text: str) -> List[str]:
+def generate_structure_suggestions(resume_text: str, resume_lower: str = None) -> List[str]:
     """Generate resume structure improvement suggestions."""
     suggestions = []
-    
+
+    if resume_lower is None:
+        resume_lower = resume_text.lower()
+
     # Check for common sections
     sections = {
         'summary': ['summary', 'objective', 'profile'],
@@ -179,10 +333,9 @@ def generate_structure_suggestions(resume_text: str) -> List[str]:
     }
     
     missing_sections = []
-    text_lower = resume_text.lower()
-    
+
     for section, keywords in sections.items():
-        if not any(keyword in text_lower for keyword in keywords):
+        if not any(keyword in resume_lower for keyword in keywords):
             missing_sections.append(section)
     
     if 'summary' in missing_sections:
@@ -191,30 +344,34 @@ def generate_structure_suggestions(resume_text: str) -> List[str]:
     if 'skills' in missing_sections:
         suggestions.append("Include a dedicated skills section to showcase your technical abilities")
     
-    # Check for bullet points
-    bullet_indicators = ['•', '*', '-', '▪']
-    has_bullets = any(indicator in resume_text for indicator in bullet_indicators)
-    
+    # Check for bullet points in one pass over the text
+    has_bullets = not _BULLET_CHARS.isdisjoint(resume_text)
+
     if not has_bullets:
         suggestions.append("Use bullet points to improve readability and highlight achievements")
     
     # Check for consistent formatting
-    if len(set(re.findall(r'^[\s\t]*[-*•]', resume_text, re.MULTILINE))) > 1:
+    if len(set(_BULLET_RE.findall(resume_text))) > 1:
         suggestions.append("Maintain consistent bullet point formatting throughout")
     
-    # Length recommendations
-    lines = resume_text.split('\n')
-    avg_line_length = sum(len(line) for line in lines) / len(lines) if lines else 0
-    
+    # Length recommendations: total length and newline count give the
+    # average directly, with no per-line string allocations
+    newlines = resume_text.count('\n')
+    avg_line_length = (len(resume_text) - newlines) / (newlines + 1) if resume_text else 0
+
     if avg_line_length > 100:
         suggestions.append("Consider breaking long paragraphs into shorter, more digestible points")
     
     return suggestions
 
-def generate_action_items(missing_skills: List[str], resume_text: str) -> List[str]:
+def generate_action_items(missing_skills: List[str], resume_text: str,
+                          resume_lower: str = None) -> List[str]:
     """Generate specific actionable items."""
     action_items = []
-    
+
+    if resume_lower is None:
+        resume_lower = resume_text.lower()
+
     # Skill development actions
     if missing_skills:
         priority_skills = missing_skills[:3]  # Top 3 missing skills
@@ -227,10 +384,10 @@ def generate_action_items(missing_skills: List[str], resume_text: str) -> List[s
             action_items.append(f"Look for volunteer or side projects to gain experience in {priority_skills[2]}")
     
     # Content improvement actions
-    if 'experience' not in resume_text.lower():
+    if 'experience' not in resume_lower:
         action_items.append("Add a detailed work experience section with specific achievements")
     
-    if not re.search(r'\d+', resume_text):
+    if not _DIGIT_RE.search(resume_text):
         action_items.append("Quantify your achievements with specific numbers and percentages")
     
     # Networking and research actions
@@ -245,107 +402,61 @@ def generate_action_items(missing_skills: List[str], resume_text: str) -> List[s
     
     return action_items
 
-def extract_key_requirements(job_description: str) -> List[str]:
+@functools.lru_cache(maxsize=32)
+def extract_key_requirements(job_description: str) -> Tuple[str, ...]:
     """Extract key requirements from job description."""
-    # Common requirement indicators
-    requirement_patterns = [
-        r'required?\s*:?\s*([^.;]+)',
-        r'must\s+have\s*:?\s*([^.;]+)',
-        r'essential\s*:?\s*([^.;]+)',
-        r'qualifications?\s*:?\s*([^.;]+)',
-        r'responsibilities?\s*:?\s*([^.;]+)'
-    ]
-    
     requirements = []
     text_lower = job_description.lower()
-    
-    for pattern in requirement_patterns:
-        matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-        for match in matches:
-            req_text = match.group(1).strip()
-            # Split by common separators and clean
-            req_items = re.split(r'[,;|&\n]+', req_text)
-            for item in req_items:
-                clean_item = item.strip()
-                if len(clean_item) > 3 and len(clean_item.split()) <= 4:
-                    requirements.append(clean_item)
-    
-    return requirements[:10]  # Return top 10
-
-def extract_keywords_from_job(job_description: str) -> List[str]:
-    """Extract important keywords from job description."""
-    # Technical terms and skills
-    tech_patterns = [
-        r'\b[A-Z]{2,}\b',  # Acronyms
-        r'\b\w+\.js\b',    # JavaScript frameworks
-        r'\b\w+SQL\b',     # Database variants
-        r'\b\w+-\w+\b'     # Hyphenated terms
-    ]
-    
-    keywords = []
-    
-    # Extract using patterns
-    for pattern in tech_patterns:
-        matches = re.findall(pattern, job_description)
-        keywords.extend(matches)
-    
-    # Extract common technical terms
-    common_tech_terms = [
-        'python', 'java', 'javascript', 'react', 'angular', 'vue',
-        'sql', 'mysql', 'postgresql', 'mongodb', 'redis',
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes',
-        'git', 'linux', 'agile', 'scrum', 'ci/cd'
-    ]
-    
+
+    # One pass over the text finds clauses for every requirement lead-in
+    for match in _REQUIREMENT_RE.finditer(text_lower):
+        req_text = match.group(1).strip()
+        # Split by common separators and clean
+        req_items = _SPLIT_RE.split(req_text)
+        for item in req_items:
+            clean_item = item.strip()
+            if len(clean_item) > 3 and len(clean_item.split()) <= 4:
+                requirements.append(clean_item)
+    
+    return tuple(requirements[:10])  # Return top 10
+
+@functools.lru_cache(maxsize=32)
+def extract_keywords_from_job(job_description: str) -> FrozenSet[str]:
+    """Extract important keywords from job description, lowercased."""
     job_lower = job_description.lower()
-    for term in common_tech_terms:
-        if term in job_lower:
-            keywords.append(term)
-    
-    # Remove duplicates and return
-    return list(set(keywords))
 
-def extract_industry_terms(job_description: str) -> List[str]:
+    # Technical-looking terms in one pass, plus the common-term lookups;
+    # the frozenset deduplicates and supports set operations downstream
+    return (
+        frozenset(m.lower() for m in _TECH_RE.findall(job_description)) |
+        {term for term in _COMMON_TECH_TERMS if term in job_lower}
+    )
+
+@functools.lru_cache(maxsize=32)
+def extract_industry_terms(job_description: str) -> Tuple[str, ...]:
     """Extract industry-specific terms."""
-    industry_indicators = {
-        'finance': ['financial', 'banking', 'trading', 'investment', 'fintech'],
-        'healthcare': ['healthcare', 'medical', 'patient', 'clinical', 'pharma'],
-        'ecommerce': ['ecommerce', 'retail', 'marketplace', 'customer', 'sales'],
-        'saas': ['saas', 'subscription', 'platform', 'cloud', 'enterprise'],
-        'gaming': ['gaming', 'game', 'unity', 'unreal', 'mobile games'],
-        'ai_ml': ['ai', 'machine learning', 'deep learning', 'neural', 'nlp']
-    }
-    
-    job_lower = job_description.lower()
-    industry_terms = []
-    
-    for industry, terms in industry_indicators.items():
-        for term in terms:
-            if term in job_lower:
-                industry_terms.append(term)
-    
-    return list(set(industry_terms))
+    # One alternation scan over the text replaces a substring search per term
+    return tuple(set(_INDUSTRY_RE.findall(job_description.lower())))
 
-def generate_synonym_suggestions(resume_text: str, job_description: str) -> List[str]:
+def generate_synonym_suggestions(resume_text: str, job_description: str,
+                                 resume_lower: str = None) -> List[str]:
     """Generate suggestions for using synonyms to match job description language."""
     suggestions = []
-    
-    synonym_map = {
-        'developed': ['built', 'created', 'designed', 'implemented'],
-        'managed': ['led', 'supervised', 'oversaw', 'directed'],
-        'improved': ['enhanced', 'optimized', 'upgraded', 'refined'],
-        'worked': ['collaborated', 'partnered', 'contributed', 'participated'],
-        'used': ['utilized', 'employed', 'leveraged', 'applied']
-    }
-    
-    resume_lower = resume_text.lower()
-    job_lower = job_description.lower()
-    
-    for base_word, synonyms in synonym_map.items():
-        if base_word in resume_lower:
-            # Check if job description uses any synonyms
-            job_synonyms = [syn for syn in synonyms if syn in job_lower]
-            if job_synonyms:
-                suggestions.append(f"Consider using '{job_synonyms[0]}' instead of '{base_word}' to match job language")
-    
+
+    if resume_lower is None:
+        resume_lower = resume_text.lower()
+
+    # Base words present in the resume, found in a single alternation scan
+    resume_bases = set(_BASE_WORD_RE.findall(resume_lower))
+    if not resume_bases:
+        return suggestions
+
+    # One scan of the job description finds every synonym; the first
+    # occurrence wins for each base word
+    for synonym in _SYNONYM_RE.findall(job_description.lower()):
+        base_word = _SYN_TO_BASE[synonym]
+        if base_word in resume_bases:
+            resume_bases.discard(base_word)
+            suggestions.append(f"Consider using '{synonym}' instead of '{base_word}' to match job language")
+
     return suggestions
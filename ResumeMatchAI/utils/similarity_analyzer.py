@@ -1,44 +1,95 @@
+import functools
+import hashlib
+import threading
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from collections import OrderedDict
+from sklearn.feature_extraction.text import HashingVectorizer
 import streamlit as st
 from typing import List, Tuple
-import re
+# Prefer google-re2 when available for linear-time matching of the
+# header alternation; the stdlib engine is a drop-in fallback.
+try:
+    import re2 as re
+except ImportError:
+    import re
+
+# Maximum number of similarity scores kept in the per-analyzer cache
+SCORE_CACHE_SIZE = 512
+
+@functools.lru_cache(maxsize=1)
+def _make_vectorizer() -> HashingVectorizer:
+    """Build the shared hashing vectorizer exactly once per process.
+
+    The hashing trick needs no fitted vocabulary, so transform is
+    stateless: no per-call dict build and the rows come out L2-normalized,
+    making cosine similarity a plain dot product.
+    """
+    return HashingVectorizer(
+        n_features=2 ** 15,
+        alternate_sign=False,
+        stop_words='english',
+        ngram_range=(1, 2),
+        lowercase=True,
+        norm='l2',
+        dtype=np.float32
+    )
+
+
+# Section headers recognized by _extract_sections, mapped to their
+# canonical section name
+_SECTION_HEADERS = {
+    'work experience': 'experience',
+    'professional experience': 'experience',
+    'experience': 'experience',
+    'employment': 'experience',
+    'technical skills': 'skills',
+    'skills': 'skills',
+    'competencies': 'skills',
+    'education': 'education',
+    'academic': 'education',
+    'qualifications': 'education',
+    'summary': 'summary',
+    'objective': 'summary',
+    'profile': 'summary',
+}
+
+# Single fused preprocessing pattern: any run of characters that is neither
+# a word character nor kept punctuation (including whitespace) collapses to
+# one space
+_PREPROC_RE = re.compile(r'[^\w\.\,\;\:\!\?]+')
+
+# Longer alternatives first so e.g. 'work experience' wins over 'experience'
+_HEADER_RE = re.compile(
+    r'\b(work\s+experience|professional\s+experience|technical\s+skills|'
+    r'experience|employment|skills|competencies|education|academic|'
+    r'qualifications|summary|objective|profile)\b',
+    re.IGNORECASE
+)
 
 class SimilarityAnalyzer:
     """
-    Class for computing semantic similarity between text documents using TF-IDF vectorization.
+    Class for computing semantic similarity between text documents using
+    hashed term-frequency vectorization.
     """
-    
-    def __init__(self, model_name: str = 'tfidf'):
+
+    def __init__(self, model_name: str = 'hashing'):
         """
         Initialize the similarity analyzer.
-        
+
         Args:
-            model_name: Name of the vectorization method to use ('tfidf' for TF-IDF)
+            model_name: Name of the vectorization method to use
+                ('hashing' for hashed term frequencies)
         """
         self.model_name = model_name
-        self.vectorizer = None
-        self._load_model()
-    
-    @st.cache_resource
-    def _load_model(_self):
-        """Load the TF-IDF vectorizer (cached)."""
-        try:
-            # Create TF-IDF vectorizer with optimized parameters
-            vectorizer = TfidfVectorizer(
-                max_features=5000,
-                stop_words='english',
-                ngram_range=(1, 2),
-                lowercase=True,
-                min_df=1,
-                max_df=0.95
-            )
-            return vectorizer
-        except Exception as e:
-            st.error(f"Error loading TF-IDF vectorizer: {str(e)}")
-            return None
-    
+        self.vectorizer = _make_vectorizer()
+        # LRU cache of similarity scores keyed by content hashes, so
+        # re-analyzing the same resume/job description pair skips the
+        # vectorization entirely. The analyzer is shared across sessions
+        # (st.cache_resource) and Streamlit sessions run on separate
+        # threads, so every cache mutation happens under this lock
+        self._score_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
     def preprocess_text(self, text: str) -> str:
         """
         Preprocess text for better similarity computation.
@@ -51,24 +102,39 @@ class SimilarityAnalyzer:
         """
         if not text:
             return ""
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s\.\,\;\:\!\?]', ' ', text)
-        
-        # Remove extra spaces
-        text = text.strip()
-        
-        return text
+
+        # Lowercase, then collapse whitespace and strip special characters
+        # in a single precompiled pass
+        return _PREPROC_RE.sub(' ', text.lower()).strip()
     
+    @staticmethod
+    def _cache_key(text1: str, text2: str) -> str:
+        """Build a stable cache key from the content of both texts."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(text1.encode('utf-8', 'ignore'))
+        h.update(b'\x00')
+        h.update(text2.encode('utf-8', 'ignore'))
+        return h.hexdigest()
+
+    def _cache_get(self, key: str):
+        """Look up a cached score, refreshing its LRU position on hit."""
+        with self._cache_lock:
+            score = self._score_cache.get(key)
+            if score is not None:
+                self._score_cache.move_to_end(key)
+            return score
+
+    def _cache_put(self, key: str, score: float):
+        """Store a score, evicting the least recently used entry if full."""
+        with self._cache_lock:
+            self._score_cache[key] = score
+            self._score_cache.move_to_end(key)
+            if len(self._score_cache) > SCORE_CACHE_SIZE:
+                self._score_cache.popitem(last=False)
+
     def compute_similarity(self, text1: str, text2: str) -> float:
         """
-        Compute semantic similarity between two texts using TF-IDF.
+        Compute similarity between two texts using hashed term frequencies.
         
         Args:
             text1: First text (e.g., resume)
@@ -77,13 +143,16 @@ class SimilarityAnalyzer:
         Returns:
             Similarity score as percentage (0-100)
         """
-        if not self.vectorizer:
-            self.vectorizer = self._load_model()
-            
-        if not self.vectorizer:
-            st.error("Could not load TF-IDF vectorizer")
+        # Whitespace-only input can never match; skip all vectorization work
+        if not text1 or not text1.strip() or not text2 or not text2.strip():
             return 0.0
-        
+
+        # Return the cached score if this exact pair was analyzed before
+        cache_key = self._cache_key(text1 or "", text2 or "")
+        cached_score = self._cache_get(cache_key)
+        if cached_score is not None:
+            return cached_score
+
         try:
             # Preprocess texts
             processed_text1 = self.preprocess_text(text1)
@@ -94,68 +163,144 @@ class SimilarityAnalyzer:
             
             # Create corpus with both texts
             corpus = [processed_text1, processed_text2]
-            
-            # Generate TF-IDF vectors
-            tfidf_matrix = self.vectorizer.fit_transform(corpus)
-            
-            # Compute cosine similarity
-            similarity_matrix = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
-            similarity = similarity_matrix[0][0]
+
+            # Generate hashed term-frequency vectors (stateless transform)
+            term_matrix = self.vectorizer.transform(corpus)
+
+            # Rows are already L2-normalized, so cosine is a sparse dot
+            similarity = (term_matrix[0] @ term_matrix[1].T).toarray()[0, 0]
             
             # Convert to percentage and ensure it's between 0 and 100
             similarity_percentage = max(0, min(100, similarity * 100))
-            
+
+            self._cache_put(cache_key, similarity_percentage)
             return similarity_percentage
             
         except Exception as e:
             st.error(f"Error computing similarity: {str(e)}")
             return 0.0
     
-    def compute_section_similarities(self, resume_text: str, job_description: str) -> dict:
+    def compute_similarity_batch(self, texts: List[str], query: str) -> List[float]:
+        """
+        Compute similarity between multiple texts and a single query text.
+
+        All texts and the query are vectorized together in one pass, and the
+        cosine similarities are computed as a single matrix operation instead
+        of one pairwise call per text.
+
+        Args:
+            texts: List of texts to compare (e.g., resumes)
+            query: Query text (e.g., job description)
+
+        Returns:
+            List of similarity scores as percentages (0-100), one per text
+        """
+        # Partition into cache hits and misses; only misses get vectorized
+        results = [None] * len(texts)
+        cache_keys = [self._cache_key(text or "", query or "") for text in texts]
+        miss_indices = []
+        for i, key in enumerate(cache_keys):
+            cached_score = self._cache_get(key)
+            if cached_score is not None:
+                results[i] = cached_score
+            else:
+                miss_indices.append(i)
+
+        if not miss_indices:
+            return results
+
+        try:
+            # Preprocess the uncached texts and the query
+            processed_texts = [self.preprocess_text(texts[i]) for i in miss_indices]
+            processed_query = self.preprocess_text(query)
+
+            if not processed_query or not any(processed_texts):
+                for i in miss_indices:
+                    results[i] = 0.0
+                return results
+
+            # Vectorize everything in a single pass (query last); rows come
+            # out L2-normalized so cosine reduces to a dot product
+            corpus = processed_texts + [processed_query]
+            term_matrix = self.vectorizer.transform(corpus)
+
+            # One sparse matrix-vector product instead of N pairwise calls
+            scores = (term_matrix[:-1] @ term_matrix[-1].T).toarray().ravel() * 100
+
+            for pos, i in enumerate(miss_indices):
+                score = max(0.0, min(100.0, float(scores[pos]))) if processed_texts[pos] else 0.0
+                results[i] = score
+                self._cache_put(cache_keys[i], score)
+
+            return results
+
+        except Exception as e:
+            st.error(f"Error computing batch similarities: {str(e)}")
+            return [0.0 if score is None else score for score in results]
+
+    def compute_section_similarities(
+        self, resume_text: str, job_description: str
+    ) -> Tuple[np.ndarray, List[str], List[str]]:
         """
         Compute similarities between different sections of resume and job description.
-        
+
         Args:
             resume_text: Resume text
             job_description: Job description text
-            
+
         Returns:
-            Dictionary with section-wise similarities
+            Tuple of (score_matrix, resume_sections, job_sections) where
+            score_matrix[i, j] is the similarity percentage (0-100) between
+            resume_sections[i] and job_sections[j]. All three are empty
+            when either text has no recognizable sections.
         """
-        if not self.vectorizer:
-            self.vectorizer = self._load_model()
-            
-        if not self.vectorizer:
-            return {}
-        
         try:
             # Extract sections from resume
             resume_sections = self._extract_sections(resume_text)
-            
+
             # Extract sections from job description
             job_sections = self._extract_sections(job_description)
-            
-            similarities = {}
-            
-            for resume_section, resume_content in resume_sections.items():
-                for job_section, job_content in job_sections.items():
-                    if resume_content and job_content:
-                        similarity = self.compute_similarity(resume_content, job_content)
-                        similarities[f"{resume_section}_vs_{job_section}"] = similarity
-            
-            return similarities
-            
+
+            resume_names = [name for name, content in resume_sections.items() if content]
+            job_names = [name for name, content in job_sections.items() if content]
+
+            if not resume_names or not job_names:
+                return np.empty((0, 0), dtype=np.float32), [], []
+
+            # Vectorize every section in one stateless pass
+            corpus = (
+                [self.preprocess_text(resume_sections[name]) for name in resume_names] +
+                [self.preprocess_text(job_sections[name]) for name in job_names]
+            )
+            term_matrix = self.vectorizer.transform(corpus)
+
+            # Rows are already L2-normalized by the vectorizer, so the
+            # cosine block is a plain sparse matrix product — no pairwise
+            # machinery and no extra normalization pass. The scores stay in
+            # one contiguous float32 array instead of being boxed into a
+            # dict of named scalars
+            sim_block = (
+                term_matrix[:len(resume_names)] @ term_matrix[len(resume_names):].T
+            ).toarray() * 100
+
+            scores = np.clip(sim_block, 0.0, 100.0).astype(np.float32)
+            return scores, resume_names, job_names
+
         except Exception as e:
             st.error(f"Error computing section similarities: {str(e)}")
-            return {}
+            return np.empty((0, 0), dtype=np.float32), [], []
     
     def _extract_sections(self, text: str) -> dict:
         """
-        Extract different sections from text based on common patterns.
-        
+        Extract different sections from text based on common header keywords.
+
+        The text is scanned once for section headers; each section's content
+        runs from its header to the next recognized header. The first
+        occurrence of a section wins.
+
         Args:
             text: Input text
-            
+
         Returns:
             Dictionary with section names and content
         """
@@ -165,74 +310,37 @@ class SimilarityAnalyzer:
             'education': '',
             'summary': ''
         }
-        
+
         # Convert to lowercase for pattern matching
         text_lower = text.lower()
-        
-        # Define section patterns
-        patterns = {
-            'experience': [
-                r'work\s+experience.*?(?=education|skills|summary|$)',
-                r'experience.*?(?=education|skills|summary|$)',
-                r'employment.*?(?=education|skills|summary|$)',
-                r'professional\s+experience.*?(?=education|skills|summary|$)'
-            ],
-            'skills': [
-                r'skills.*?(?=experience|education|summary|$)',
-                r'technical\s+skills.*?(?=experience|education|summary|$)',
-                r'competencies.*?(?=experience|education|summary|$)'
-            ],
-            'education': [
-                r'education.*?(?=experience|skills|summary|$)',
-                r'academic.*?(?=experience|skills|summary|$)',
-                r'qualifications.*?(?=experience|skills|summary|$)'
-            ],
-            'summary': [
-                r'summary.*?(?=experience|skills|education|$)',
-                r'objective.*?(?=experience|skills|education|$)',
-                r'profile.*?(?=experience|skills|education|$)'
-            ]
-        }
-        
-        for section, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-                if match:
-                    sections[section] = match.group(0)
-                    break
-        
+
+        matches = list(_HEADER_RE.finditer(text_lower))
+
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            header = ' '.join(match.group(1).split())
+            section = _SECTION_HEADERS[header]
+            end = next_match.start() if next_match else len(text_lower)
+
+            if not sections[section]:
+                sections[section] = text_lower[match.start():end]
+
         return sections
-    
+
     def batch_similarity(self, texts1: List[str], text2: str) -> List[float]:
         """
         Compute similarity between multiple texts and a single reference text.
-        
+
         Args:
             texts1: List of texts to compare
             text2: Reference text
-            
+
         Returns:
             List of similarity scores
         """
-        if not self.vectorizer:
-            self.vectorizer = self._load_model()
-            
-        if not self.vectorizer:
-            return [0.0] * len(texts1)
-        
-        try:
-            similarities = []
-            
-            for text1 in texts1:
-                similarity = self.compute_similarity(text1, text2)
-                similarities.append(similarity)
-            
-            return similarities
-            
-        except Exception as e:
-            st.error(f"Error computing batch similarities: {str(e)}")
-            return [0.0] * len(texts1)
-    
+        # Delegate to the batched path: one vectorization pass and a single
+        # sparse matrix product instead of a Python loop of pairwise calls
+        return self.compute_similarity_batch(texts1, text2)
+
     def get_model_info(self) -> dict:
         """
         Get information about the loaded vectorizer.
@@ -246,7 +354,7 @@ class SimilarityAnalyzer:
         return {
             'status': 'loaded',
             'model_name': self.model_name,
-            'vectorizer_type': 'TF-IDF',
-            'max_features': getattr(self.vectorizer, 'max_features', 'unknown'),
+            'vectorizer_type': 'hashing',
+            'n_features': getattr(self.vectorizer, 'n_features', 'unknown'),
             'ngram_range': getattr(self.vectorizer, 'ngram_range', 'unknown')
         }
@@ -1,8 +1,32 @@
+import hashlib
+import threading
 import spacy
+from spacy.matcher import PhraseMatcher
 import re
+from collections import OrderedDict
 from typing import List, Tuple, Set
 import streamlit as st
 
+# Maximum number of extraction results kept in the per-extractor cache
+SKILL_CACHE_SIZE = 64
+
+# Segment boundary for the long-document pre-filter. Extracted documents
+# arrive with all newlines collapsed to spaces (clean_extracted_text),
+# so sentence punctuation is the only structure left to split on
+_SEGMENT_RE = re.compile(r'(?<=[.!?;:])\s+')
+
+# Common words that are never skills; hoisted to module scope so the
+# set is built once instead of on every _is_likely_skill call
+_COMMON_WORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'about', 'into', 'through', 'during', 'before', 'after',
+    'above', 'below', 'up', 'down', 'out', 'off', 'over', 'under', 'again',
+    'further', 'then', 'once', 'here', 'there', 'when', 'where', 'why',
+    'how', 'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other',
+    'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so',
+    'than', 'too', 'very', 'can', 'will', 'just', 'should', 'now'
+})
+
 class SkillExtractor:
     """
     Class for extracting and comparing skills from text documents.
@@ -10,16 +34,27 @@ class SkillExtractor:
     
     def __init__(self):
         """Initialize the skill extractor."""
-        self.nlp = None
-        self._load_nlp_model()
+        self.nlp = self._load_nlp_model()
         self._initialize_skill_patterns()
+        # LRU cache of extraction results keyed by content hash, so
+        # re-analyzing the same document skips the regex and spaCy work.
+        # The extractor is shared across sessions (st.cache_resource) and
+        # sessions run on separate threads, so cache reads and writes go
+        # through this lock
+        self._skill_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     @st.cache_resource
     def _load_nlp_model(_self):
         """Load spaCy model (cached)."""
         try:
-            # Try to load the English model
-            nlp = spacy.load("en_core_web_sm")
+            # Try to load the English model. Extraction only reads
+            # doc.ents and the PhraseMatcher hits, so everything except
+            # tok2vec and ner is dead weight
+            nlp = spacy.load(
+                "en_core_web_sm",
+                disable=["tagger", "parser", "attribute_ruler", "lemmatizer"]
+            )
             return nlp
         except OSError:
             try:
@@ -72,6 +107,86 @@ class SkillExtractor:
         for category_skills in self.technical_skills.values():
             self.all_skills.extend(category_skills)
         self.all_skills.extend(self.soft_skills)
+
+        # Every known skill folded into one alternation, longest first so
+        # multi-word skills win over their prefixes; a single scan of the
+        # text replaces one regex search per skill
+        self._skill_re = re.compile(
+            r'\b(?:' + '|'.join(
+                re.escape(skill)
+                for skill in sorted(self.all_skills, key=len, reverse=True)
+            ) + r')\b'
+        )
+
+        # The nine skill-context patterns fused into one alternation with
+        # two capture groups: prose lead-ins ("proficient in ...") and
+        # labeled lists ("skills: ...")
+        self._context_re = re.compile(
+            r'(?:experience|proficient|skilled|knowledge|familiar|expertise)'
+            r'\s+(?:with|in|of)\s+([^,.;]+)'
+            r'|(?:technologies|skills|tools):\s*([^.;]+)',
+            re.IGNORECASE
+        )
+        self._split_re = re.compile(r'[,;|&\n]+')
+
+        # Trigger words marking lines worth parsing when a long document
+        # is pre-filtered before the spaCy pass
+        self._nlp_trigger_re = re.compile(
+            r'experience|proficient|skilled|knowledge|familiar|expertise|'
+            r'technologies|skills|tools',
+            re.IGNORECASE
+        )
+
+        # Frozenset for O(1) membership probes in _is_likely_skill, which
+        # runs on every entity, noun chunk and context split
+        self._all_skills_set = frozenset(self.all_skills)
+
+        # Inverted index so categorize_skills resolves a skill's category
+        # with one dict probe instead of scanning every category list
+        self._skill_to_category = {
+            skill: category
+            for category, category_skills in self.technical_skills.items()
+            for skill in category_skills
+        }
+        self._soft_skills_set = frozenset(self.soft_skills)
+
+        # C-level phrase matching over the known skill list replaces the
+        # noun-chunk walk in the spaCy pass, so no dependency parse is
+        # needed to surface multi-token skills
+        self._matcher = None
+        if self.nlp:
+            self._matcher = PhraseMatcher(self.nlp.vocab, attr='LOWER')
+            self._matcher.add(
+                'SKILLS', [self.nlp.make_doc(skill) for skill in self.all_skills]
+            )
+
+        # Common abbreviations and variations mapped to a canonical skill
+        # (identity entries included), so two skills can be compared by
+        # canonical form instead of walking the variations per pair
+        self.skill_variations = {
+            'javascript': ['js', 'ecmascript'],
+            'python': ['py'],
+            'machine learning': ['ml'],
+            'artificial intelligence': ['ai'],
+            'database': ['db'],
+            'sql server': ['mssql', 'microsoft sql'],
+            'postgresql': ['postgres'],
+            'amazon web services': ['aws'],
+            'google cloud platform': ['gcp'],
+            'microsoft azure': ['azure'],
+        }
+        self._variation_to_canon = {}
+        for base_skill, variations in self.skill_variations.items():
+            self._variation_to_canon[base_skill] = base_skill
+            for variation in variations:
+                self._variation_to_canon[variation] = base_skill
+
+        # File extensions, JavaScript libraries and database variants
+        # fused into one technical-indicator search
+        self._tech_indicator_re = re.compile(
+            r'\b\w+\.(?:js|py|java|cpp|cs|rb|php)\b|\b\w+SQL\b|\b\w+DB\b',
+            re.IGNORECASE
+        )
     
     def extract_skills(self, text: str) -> List[str]:
         """
@@ -83,53 +198,131 @@ class SkillExtractor:
         Returns:
             List of extracted skills
         """
-        if not text:
+        if not text or not text.strip():
             return []
-        
-        extracted_skills = set()
-        
-        # Load NLP model if not already loaded
-        if not self.nlp:
-            self.nlp = self._load_nlp_model()
-        
-        # Convert to lowercase for matching
-        text_lower = text.lower()
-        
-        # Extract skills using pattern matching
-        pattern_skills = self._extract_skills_by_patterns(text_lower)
-        extracted_skills.update(pattern_skills)
-        
-        # Extract skills using NLP if model is available
+
+        # Single-document case of the batched path, so both share one
+        # implementation and the spaCy call always goes through nlp.pipe
+        return self.extract_skills_batch([text])[0]
+
+    def extract_skills_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract skills from multiple texts in a single batched pass.
+
+        Pattern and context extraction run per text as usual, but the spaCy
+        pipeline processes all documents through nlp.pipe, which batches
+        them internally instead of paying per-call setup for each document.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of extracted skill lists, one per input text
+        """
+        if not texts:
+            return []
+
+        # Partition into cache hits and misses; only misses are analyzed
+        results = [None] * len(texts)
+        cache_keys = []
+        miss_indices = []
+        for i, text in enumerate(texts):
+            key = hashlib.blake2b(
+                (text or "").encode('utf-8', 'ignore'), digest_size=16
+            ).hexdigest()
+            cache_keys.append(key)
+            with self._cache_lock:
+                cached_skills = self._skill_cache.get(key)
+                if cached_skills is not None:
+                    self._skill_cache.move_to_end(key)
+            if cached_skills is not None:
+                results[i] = list(cached_skills)
+            else:
+                miss_indices.append(i)
+
+        if not miss_indices:
+            return results
+
+        miss_texts = [texts[i] for i in miss_indices]
+        skill_sets = []
+        for text in miss_texts:
+            extracted_skills = set()
+            if text:
+                text_lower = text.lower()
+                extracted_skills.update(self._extract_skills_by_patterns(text_lower))
+                extracted_skills.update(self._extract_skills_by_context(text_lower))
+            skill_sets.append(extracted_skills)
+
+        # Run the spaCy pipeline over all documents at once, pre-filtering
+        # long ones down to the lines that can actually mention skills
         if self.nlp:
-            nlp_skills = self._extract_skills_by_nlp(text)
-            extracted_skills.update(nlp_skills)
-        
-        # Extract additional skills using keyword context
-        context_skills = self._extract_skills_by_context(text_lower)
-        extracted_skills.update(context_skills)
-        
-        return list(extracted_skills)
-    
+            docs = self.nlp.pipe(
+                [self._filter_text_for_nlp(text or "") for text in miss_texts],
+                batch_size=32
+            )
+            for extracted_skills, doc in zip(skill_sets, docs):
+                extracted_skills.update(self._extract_skills_from_doc(doc))
+
+        # Store the misses, evicting the least recently used entries
+        for i, extracted_skills in zip(miss_indices, skill_sets):
+            skills = list(extracted_skills)
+            results[i] = skills
+            with self._cache_lock:
+                self._skill_cache[cache_keys[i]] = tuple(skills)
+                self._skill_cache.move_to_end(cache_keys[i])
+                if len(self._skill_cache) > SKILL_CACHE_SIZE:
+                    self._skill_cache.popitem(last=False)
+
+        return results
+
+    # Documents longer than this are line-filtered before parsing
+    _NLP_CHAR_LIMIT = 20000
+
+    def _filter_text_for_nlp(self, text: str) -> str:
+        """
+        Reduce a long document to the segments likely to mention skills.
+
+        Parser cost is linear in tokens, so for long documents only the
+        sentence-level segments containing a skill-context trigger word or
+        a known skill are sent through the pipeline. Extraction collapses
+        newlines to spaces before the text gets here, so the split runs on
+        sentence punctuation rather than line breaks. Shorter documents
+        pass through unchanged.
+
+        Args:
+            text: Raw document text
+
+        Returns:
+            Text to feed into the spaCy pipeline
+        """
+        if len(text) <= self._NLP_CHAR_LIMIT:
+            return text
+
+        return ' '.join(
+            segment for segment in _SEGMENT_RE.split(text)
+            if self._nlp_trigger_re.search(segment) or
+            self._skill_re.search(segment.lower())
+        )
+
     def _extract_skills_by_patterns(self, text: str) -> List[str]:
         """Extract skills using predefined patterns."""
-        found_skills = []
-        
-        for skill in self.all_skills:
-            # Create pattern for skill matching
-            skill_pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            
-            if re.search(skill_pattern, text):
-                found_skills.append(skill)
-        
-        return found_skills
+        # One pass over the text finds every known skill at once
+        return list(set(self._skill_re.findall(text)))
     
     def _extract_skills_by_nlp(self, text: str) -> List[str]:
         """Extract skills using NLP techniques."""
-        found_skills = []
-        
         try:
             doc = self.nlp(text)
-            
+        except Exception:
+            return []
+
+        return self._extract_skills_from_doc(doc)
+
+    def _extract_skills_from_doc(self, doc) -> List[str]:
+        """Extract skill candidates from an already-processed spaCy Doc."""
+        found_skills = []
+
+        try:
             # Extract entities that might be skills
             for ent in doc.ents:
                 if ent.label_ in ['ORG', 'PRODUCT', 'LANGUAGE']:
@@ -137,11 +330,10 @@ class SkillExtractor:
                     if self._is_likely_skill(skill_candidate):
                         found_skills.append(skill_candidate)
             
-            # Extract noun phrases that might be skills
-            for chunk in doc.noun_chunks:
-                chunk_text = chunk.text.lower().strip()
-                if self._is_likely_skill(chunk_text):
-                    found_skills.append(chunk_text)
+            # Match known skill phrases at the token level
+            if self._matcher is not None:
+                for _, start, end in self._matcher(doc):
+                    found_skills.append(doc[start:end].text.lower())
         
         except Exception as e:
             # If NLP processing fails, continue with other methods
@@ -152,32 +344,19 @@ class SkillExtractor:
     def _extract_skills_by_context(self, text: str) -> List[str]:
         """Extract skills by looking for contextual patterns."""
         found_skills = []
-        
-        # Patterns that often precede or follow skills
-        skill_contexts = [
-            r'experience\s+(?:with|in)\s+([^,.;]+)',
-            r'proficient\s+(?:with|in)\s+([^,.;]+)',
-            r'skilled\s+(?:with|in)\s+([^,.;]+)',
-            r'knowledge\s+(?:of|in)\s+([^,.;]+)',
-            r'familiar\s+(?:with|in)\s+([^,.;]+)',
-            r'expertise\s+(?:with|in)\s+([^,.;]+)',
-            r'technologies:\s*([^.;]+)',
-            r'skills:\s*([^.;]+)',
-            r'tools:\s*([^.;]+)'
-        ]
-        
-        for pattern in skill_contexts:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                skill_text = match.group(1).strip()
-                # Split by common separators
-                potential_skills = re.split(r'[,;|&\n]+', skill_text)
-                
-                for potential_skill in potential_skills:
-                    clean_skill = potential_skill.strip().lower()
-                    if self._is_likely_skill(clean_skill):
-                        found_skills.append(clean_skill)
-        
+
+        # One pass over the text finds every contextual hit; exactly one
+        # of the two capture groups is populated per match
+        for match in self._context_re.finditer(text):
+            skill_text = (match.group(1) or match.group(2)).strip()
+            # Split by common separators
+            potential_skills = self._split_re.split(skill_text)
+
+            for potential_skill in potential_skills:
+                clean_skill = potential_skill.strip().lower()
+                if self._is_likely_skill(clean_skill):
+                    found_skills.append(clean_skill)
+
         return found_skills
     
     def _is_likely_skill(self, text: str) -> bool:
@@ -199,38 +378,26 @@ class SkillExtractor:
         # Skip if too long (likely not a skill)
         if len(text.split()) > 4:
             return False
-        
+
+        # Reject snippets with no alphanumeric content (stray separators,
+        # bullet fragments) before any set or regex work
+        if not any(c.isalnum() for c in text):
+            return False
+
+        # Lowercase once; both membership probes below use it
+        text_lower = text.lower()
+
         # Skip common words that are not skills
-        common_words = {
-            'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'from', 'about', 'into', 'through', 'during', 'before', 'after',
-            'above', 'below', 'up', 'down', 'out', 'off', 'over', 'under', 'again',
-            'further', 'then', 'once', 'here', 'there', 'when', 'where', 'why',
-            'how', 'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other',
-            'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so',
-            'than', 'too', 'very', 'can', 'will', 'just', 'should', 'now'
-        }
-        
-        if text.lower() in common_words:
+        if text_lower in _COMMON_WORDS:
             return False
-        
+
         # Check if it's in our predefined skills list
-        if text.lower() in self.all_skills:
+        if text_lower in self._all_skills_set:
             return True
-        
-        # Additional heuristics for technical terms
-        technical_indicators = [
-            r'\b\w+\.(js|py|java|cpp|cs|rb|php)\b',  # File extensions
-            r'\b\w+\.js\b',  # JavaScript libraries
-            r'\b\w+SQL\b',  # Database variants
-            r'\b\w+DB\b',   # Database variants
-        ]
-        
-        for indicator in technical_indicators:
-            if re.search(indicator, text, re.IGNORECASE):
-                return True
-        
-        return False
+
+        # Additional heuristics for technical terms: file extensions,
+        # JavaScript libraries and database variants in one search
+        return bool(self._tech_indicator_re.search(text))
     
     def compare_skills(self, resume_skills: List[str], job_skills: List[str]) -> Tuple[List[str], List[str]]:
         """
@@ -243,38 +410,39 @@ class SkillExtractor:
         Returns:
             Tuple of (matched_skills, missing_skills)
         """
-        # Convert to lowercase sets for comparison
-        resume_skills_lower = {skill.lower() for skill in resume_skills}
-        job_skills_lower = {skill.lower() for skill in job_skills}
-        
-        # Find exact matches
-        exact_matches = resume_skills_lower.intersection(job_skills_lower)
-        
-        # Find fuzzy matches (partial matches)
-        fuzzy_matches = set()
-        for job_skill in job_skills_lower:
-            for resume_skill in resume_skills_lower:
-                if self._are_skills_similar(job_skill, resume_skill):
-                    fuzzy_matches.add(job_skill)
-                    break
-        
-        # Combine exact and fuzzy matches
-        all_matches = exact_matches.union(fuzzy_matches)
-        
-        # Find missing skills
-        missing_skills = job_skills_lower - all_matches
-        
-        # Convert back to original case (use job description case as reference)
+        # Convert to lowercase sets for O(1) membership checks
+        resume_skills_lower = frozenset(skill.lower() for skill in resume_skills)
+        job_skills_lower = frozenset(skill.lower() for skill in job_skills)
+
+        # Find exact matches via set intersection
+        all_matches = set(resume_skills_lower & job_skills_lower)
+
+        # Index the resume skills once: canonical forms resolve known
+        # abbreviations, and the token set catches skills that share a
+        # whole word (e.g. 'sql' vs 'sql server')
+        canon = self._variation_to_canon
+        resume_canon = {canon.get(skill, skill) for skill in resume_skills_lower}
+        resume_tokens = set()
+        for skill in resume_skills_lower:
+            resume_tokens.update(skill.split())
+
+        # Each remaining job skill resolves against the indexes in O(1)
+        # instead of being compared to every resume skill
+        for job_skill in job_skills_lower - all_matches:
+            job_canon = canon.get(job_skill, job_skill)
+            if job_canon in resume_canon or \
+               not resume_tokens.isdisjoint(job_skill.split()):
+                all_matches.add(job_skill)
+
+        # Split job skills in one pass, preserving job description case
         matched_skills = []
+        missing_skills_list = []
         for skill in job_skills:
             if skill.lower() in all_matches:
                 matched_skills.append(skill)
-        
-        missing_skills_list = []
-        for skill in job_skills:
-            if skill.lower() in missing_skills:
+            else:
                 missing_skills_list.append(skill)
-        
+
         return matched_skills, missing_skills_list
     
     def _are_skills_similar(self, skill1: str, skill2: str) -> bool:
@@ -291,28 +459,12 @@ class SkillExtractor:
         # Check if one skill contains the other
         if skill1 in skill2 or skill2 in skill1:
             return True
-        
-        # Check for common abbreviations and variations
-        skill_variations = {
-            'javascript': ['js', 'ecmascript'],
-            'python': ['py'],
-            'machine learning': ['ml'],
-            'artificial intelligence': ['ai'],
-            'database': ['db'],
-            'sql server': ['mssql', 'microsoft sql'],
-            'postgresql': ['postgres'],
-            'amazon web services': ['aws'],
-            'google cloud platform': ['gcp'],
-            'microsoft azure': ['azure'],
-        }
-        
-        for base_skill, variations in skill_variations.items():
-            if (skill1 == base_skill and skill2 in variations) or \
-               (skill2 == base_skill and skill1 in variations) or \
-               (skill1 in variations and skill2 in variations):
-                return True
-        
-        return False
+
+        # Known abbreviations and variations resolve to the same canonical
+        # form, so similarity is two dict probes and one comparison
+        canon1 = self._variation_to_canon.get(skill1)
+        return canon1 is not None and \
+            canon1 == self._variation_to_canon.get(skill2)
     
     def categorize_skills(self, skills: List[str]) -> dict:
         """
@@ -337,24 +489,14 @@ class SkillExtractor:
         
         for skill in skills:
             skill_lower = skill.lower()
-            categorized_skill = False
-            
-            # Check technical skills categories
-            for category, category_skills in self.technical_skills.items():
-                if skill_lower in category_skills:
-                    categorized[category].append(skill)
-                    categorized_skill = True
-                    break
-            
-            # Check soft skills
-            if not categorized_skill and skill_lower in self.soft_skills:
-                categorized['soft_skills'].append(skill)
-                categorized_skill = True
-            
-            # If not categorized, put in 'other'
-            if not categorized_skill:
-                categorized['other'].append(skill)
-        
+
+            # Technical categories first, then soft skills, then 'other'
+            category = self._skill_to_category.get(skill_lower)
+            if category is None and skill_lower in self._soft_skills_set:
+                category = 'soft_skills'
+
+            categorized[category or 'other'].append(skill)
+
         return categorized
     
     def get_skill_recommendations(self, missing_skills: List[str], category: str = None) -> List[str]:
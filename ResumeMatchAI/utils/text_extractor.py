@@ -1,8 +1,55 @@
 import fitz  # PyMuPDF
+import re
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import io
 
+# Compiled once at import; \s+ also covers newline runs, so cleaning
+# needs a single pass over the text
+_WS_RE = re.compile(r'\s+')
+
+# PDFs with at least this many pages get their pages extracted in
+# parallel; below it the thread-pool overhead outweighs the win
+_PARALLEL_PAGE_THRESHOLD = 8
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> str:
+    """
+    Extract text from a contiguous page range with a private handle.
+
+    PyMuPDF documents are not safe to share across threads, so each
+    worker reopens the document from the same bytes; MuPDF releases the
+    GIL while parsing, which is what makes the page ranges overlap.
+
+    Args:
+        pdf_bytes: Raw PDF file content
+        start: First page index (inclusive)
+        stop: Last page index (exclusive)
+
+    Returns:
+        Extracted text for the page range
+    """
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_document:
+        return "\n".join(
+            _page_words(pdf_document[i]) for i in range(start, stop)
+        )
+
+def _page_words(page) -> str:
+    """
+    Extract a page's text from its word list.
+
+    get_text() reconstructs layout (line merging and reading-order
+    sorting) that clean_extracted_text immediately flattens away; the
+    "words" mode skips that reflow and yields the same cleaned result.
+
+    Args:
+        page: PyMuPDF page object
+
+    Returns:
+        Space-joined words on the page
+    """
+    return " ".join(word[4] for word in page.get_text("words"))
+
 def extract_text_from_file(uploaded_file) -> Optional[str]:
     """
     Extract text from uploaded file (PDF or TXT).
@@ -28,70 +75,105 @@ def extract_text_from_file(uploaded_file) -> Optional[str]:
         st.error(f"Error extracting text: {str(e)}")
         return None
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _extract_text_from_pdf_bytes(pdf_bytes: bytes) -> Optional[str]:
+    """
+    Parse PDF bytes and return cleaned text.
+
+    Keyed on the raw file content, so re-uploading or rerunning with the
+    same file skips the PyMuPDF parse and cleaning entirely.
+
+    Args:
+        pdf_bytes: Raw PDF file content
+
+    Returns:
+        Extracted text as string or None if the document has no text
+    """
+    # Open the PDF from bytes; the with-block releases it as soon as
+    # extraction finishes so the document can be reclaimed early
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_document:
+        page_count = pdf_document.page_count
+        if page_count < _PARALLEL_PAGE_THRESHOLD:
+            text_content = "\n".join(_page_words(page) for page in pdf_document)
+
+    # Large documents: split the pages into ranges and extract them in
+    # parallel, one private document handle per worker
+    if page_count >= _PARALLEL_PAGE_THRESHOLD:
+        workers = min(4, -(-page_count // _PARALLEL_PAGE_THRESHOLD))
+        span = -(-page_count // workers)
+        ranges = [
+            (start, min(start + span, page_count))
+            for start in range(0, page_count, span)
+        ]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parts = executor.map(
+                lambda page_range: _extract_page_range(pdf_bytes, *page_range),
+                ranges
+            )
+            text_content = "\n".join(parts)
+
+    # Clean up the text
+    text_content = clean_extracted_text(text_content)
+
+    return text_content if text_content.strip() else None
+
 def extract_text_from_pdf(uploaded_file) -> Optional[str]:
     """
     Extract text from PDF file using PyMuPDF.
-    
+
     Args:
         uploaded_file: Streamlit uploaded file object containing PDF
-        
+
     Returns:
         Extracted text as string or None if extraction fails
     """
     try:
-        # Read the file bytes
-        pdf_bytes = uploaded_file.read()
-        
-        # Open PDF document from bytes
-        pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-        
-        text_content = ""
-        
-        # Extract text from each page
-        for page_num in range(pdf_document.page_count):
-            page = pdf_document[page_num]
-            text_content += page.get_text()
-            
-        pdf_document.close()
-        
-        # Clean up the text
-        text_content = clean_extracted_text(text_content)
-        
-        return text_content if text_content.strip() else None
-        
+        # Access the upload buffer directly without consuming the stream;
+        # identical bytes hit the content cache
+        return _extract_text_from_pdf_bytes(uploaded_file.getvalue())
+
     except Exception as e:
         st.error(f"Error extracting text from PDF: {str(e)}")
         return None
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _extract_text_from_txt_bytes(raw_bytes: bytes) -> Optional[str]:
+    """
+    Decode raw text-file bytes and return cleaned text.
+
+    Keyed on the raw file content, so reruns with the same file skip the
+    decode and cleaning.
+
+    Args:
+        raw_bytes: Raw file content
+
+    Returns:
+        File content as string or None if the file is empty
+    """
+    try:
+        text_content = raw_bytes.decode('utf-8')
+    except UnicodeDecodeError:
+        # Try different encoding
+        text_content = raw_bytes.decode('latin-1')
+
+    # Clean up the text
+    text_content = clean_extracted_text(text_content)
+
+    return text_content if text_content.strip() else None
+
 def extract_text_from_txt(uploaded_file) -> Optional[str]:
     """
     Extract text from TXT file.
-    
+
     Args:
         uploaded_file: Streamlit uploaded file object containing text
-        
+
     Returns:
         File content as string or None if extraction fails
     """
     try:
-        # Read text file
-        text_content = uploaded_file.read().decode('utf-8')
-        
-        # Clean up the text
-        text_content = clean_extracted_text(text_content)
-        
-        return text_content if text_content.strip() else None
-        
-    except UnicodeDecodeError:
-        try:
-            # Try different encoding
-            uploaded_file.seek(0)
-            text_content = uploaded_file.read().decode('latin-1')
-            text_content = clean_extracted_text(text_content)
-            return text_content if text_content.strip() else None
-        except Exception as e:
-            st.error(f"Error decoding text file: {str(e)}")
-            return None
+        return _extract_text_from_txt_bytes(uploaded_file.getvalue())
+
     except Exception as e:
         st.error(f"Error extracting text from TXT: {str(e)}")
         return None
@@ -109,17 +191,9 @@ def clean_extracted_text(text: str) -> str:
     if not text:
         return ""
     
-    # Replace multiple whitespaces with single space
-    import re
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove excessive line breaks
-    text = re.sub(r'\n+', '\n', text)
-    
-    # Strip leading/trailing whitespace
-    text = text.strip()
-    
-    return text
+    # Replace whitespace runs (including line breaks) with single spaces
+    # and strip the ends
+    return _WS_RE.sub(' ', text).strip()
 
 def validate_file_size(uploaded_file, max_size_mb: int = 10) -> bool:
     """
@@ -1,59 +1,217 @@
+import copy
+import functools
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import plotly.io as pio
 import pandas as pd
 import numpy as np
+import re
+import streamlit as st
 from typing import List, Dict
 
-def create_match_chart(similarity_score: float) -> go.Figure:
-    """
-    Create a gauge chart showing the match score.
-    
+# Serialize figures with orjson when it is installed; every
+# st.plotly_chart call pays the figure-to-JSON cost, and orjson handles
+# the nested dicts and NumPy arrays several times faster than stdlib
+# json. Plotly falls back to the default engine when orjson is absent
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+# Skill categories shown on the radar chart. Membership is encoded as
+# a keyword/category int8 matrix at import so counting skills per
+# category is one matrix product instead of a Python loop per list
+_SKILL_CATEGORIES = {
+    'Programming': ['python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby'],
+    'Web Technologies': ['html', 'css', 'react', 'angular', 'vue', 'node.js'],
+    'Databases': ['sql', 'mysql', 'postgresql', 'mongodb', 'oracle'],
+    'Cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes'],
+    'Data Science': ['machine learning', 'data analysis', 'pandas', 'numpy'],
+    'Tools': ['git', 'linux', 'jira', 'jenkins']
+}
+_CATEGORY_KEYWORDS = np.array(
+    sorted({kw for kws in _SKILL_CATEGORIES.values() for kw in kws})
+)
+# (n_keywords, n_categories): 1 where the keyword belongs to the category
+_CATEGORY_MATRIX = np.array(
+    [[kw in kws for kws in _SKILL_CATEGORIES.values()]
+     for kw in _CATEGORY_KEYWORDS],
+    dtype=np.int8
+)
+# Per-category keyword counts, used to normalize the radar scores
+_CATEGORY_SIZES = np.array(
+    [len(kws) for kws in _SKILL_CATEGORIES.values()]
+)
+
+def _category_counts(skills_low: tuple) -> np.ndarray:
+    """Count skills containing a keyword of each category.
+
+    Skill/keyword presence is built as an int8 matrix via a vectorized
+    substring scan, then one matrix product against the membership
+    table folds it into per-category counts — a skill counts toward a
+    category when it contains at least one of its keywords, matching
+    the old per-list regex loops.
+
     Args:
-        similarity_score: Similarity score (0-100)
-        
+        skills_low: Lowercased skill names
+
     Returns:
-        Plotly figure object
+        Array of counts, one per category in _SKILL_CATEGORIES order
     """
-    # Determine color based on score
-    if similarity_score >= 80:
-        color = "green"
-    elif similarity_score >= 60:
-        color = "orange"
-    else:
-        color = "red"
-    
-    fig = go.Figure(go.Indicator(
-        mode = "gauge+number+delta",
-        value = similarity_score,
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': "Match Score"},
-        delta = {'reference': 70},
-        gauge = {
+    if not skills_low:
+        return np.zeros(len(_SKILL_CATEGORIES), dtype=np.int64)
+    presence = (
+        np.char.find(np.array(skills_low)[:, None],
+                     _CATEGORY_KEYWORDS[None, :]) >= 0
+    ).astype(np.int8)
+    return ((presence @ _CATEGORY_MATRIX) > 0).sum(axis=0)
+
+# Shared layout defaults registered once at import; figures opt in by
+# template name instead of re-allocating the same font/margin dicts on
+# every call
+pio.templates['resumematcher'] = go.layout.Template(
+    layout=dict(
+        font=dict(color='darkblue', family='Arial'),
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+)
+
+@functools.lru_cache(maxsize=128)
+def _lower_tuple(skills: tuple) -> tuple:
+    """Lowercase a skill tuple once, shared across the chart builders.
+
+    The same skill lists flow into several charts per render (radar,
+    breakdown, priority), so memoizing on the tuple means each list is
+    lowercased a single time per run instead of once per chart.
+    """
+    return tuple(skill.lower() for skill in skills)
+
+# Comparison charts bigger than this render via WebGL instead of SVG
+_WEBGL_ROW_THRESHOLD = 50
+
+# Hard cap on plotted comparison rows; past this the chart shows only
+# the strongest matches and says so
+_MAX_CHART_ROWS = 200
+
+# Skills matching this are high learning priority; the color and label
+# tables are indexed by priority value (1=Low, 2=Medium, 3=High)
+_HIGH_PRIO_RE = re.compile(r'python|java|sql|machine learning|aws|react')
+_PRIORITY_COLORS = np.array(['yellow', 'orange', 'red'])
+_PRIORITY_LABELS = np.array(['Low', 'Medium', 'High'])
+
+# Static guide lines for the comparison chart, prebuilt as layout
+# shapes/annotations so the figure is assembled in one constructor call
+# instead of three add_vline layout mutations
+_SCORE_GUIDES = {
+    'shapes': [
+        dict(type='line', x0=x, x1=x, y0=0, y1=1, xref='x', yref='paper',
+             line=dict(dash='dash', color=color))
+        for x, color in ((50, 'gray'), (70, 'orange'), (90, 'green'))
+    ],
+    'annotations': [
+        dict(x=x, y=1, xref='x', yref='paper', yanchor='bottom',
+             text=label, showarrow=False)
+        for x, label in ((50, 'Minimum'), (70, 'Good'), (90, 'Excellent'))
+    ]
+}
+
+# Score bands shared by the gauge and comparison charts: below 60 is
+# red, 60-80 orange, 80+ green; np.digitize picks the band branchlessly
+_SCORE_COLORS = np.array(['red', 'orange', 'green'])
+_SCORE_EDGES = np.array([60.0, 80.0])
+
+# Prebuilt gauge spec: everything except the score and bar color is
+# static, so the figure is assembled from a cloned dict with only the
+# two dynamic values spliced in. skip_invalid lets go.Figure take the
+# dict without re-running schema validation over the known-good shape
+_MATCH_TEMPLATE = {
+    'data': [{
+        'type': 'indicator',
+        'mode': 'gauge+number+delta',
+        'value': 0,
+        'domain': {'x': [0, 1], 'y': [0, 1]},
+        'title': {'text': 'Match Score'},
+        'delta': {'reference': 70},
+        'gauge': {
             'axis': {'range': [None, 100]},
-            'bar': {'color': color},
+            'bar': {'color': 'gray'},
             'steps': [
-                {'range': [0, 50], 'color': "lightgray"},
-                {'range': [50, 70], 'color': "gray"},
-                {'range': [70, 90], 'color': "lightgreen"},
-                {'range': [90, 100], 'color': "green"}
+                {'range': [0, 50], 'color': 'lightgray'},
+                {'range': [50, 70], 'color': 'gray'},
+                {'range': [70, 90], 'color': 'lightgreen'},
+                {'range': [90, 100], 'color': 'green'}
             ],
             'threshold': {
-                'line': {'color': "red", 'width': 4},
+                'line': {'color': 'red', 'width': 4},
                 'thickness': 0.75,
                 'value': 90
             }
         }
-    ))
-    
-    fig.update_layout(
-        height=300,
-        font={'color': "darkblue", 'family': "Arial"},
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    }],
+    'layout': {
+        'template': 'resumematcher',
+        'height': 300
+    }
+}
+
+@functools.lru_cache(maxsize=32)
+def _empty_figure(title: str, message: str, height: int = 300,
+                  color: str = 'black') -> dict:
+    """Build the shared empty-state figure spec for a chart.
+
+    Empty inputs (no skills extracted, nothing missing) recur across
+    reruns, so the annotated placeholder spec is memoized and the
+    callers wrap the cached dict in go.Figure, which copies it.
+
+    Args:
+        title: Chart title
+        message: Annotation text shown in the center
+        height: Figure height in pixels
+        color: Annotation text color
+
+    Returns:
+        Plotly figure spec as a plain dict
+    """
+    hidden_axis = dict(showgrid=False, zeroline=False, showticklabels=False)
+    return {
+        'data': [],
+        'layout': {
+            'title': title,
+            'height': height,
+            'xaxis': hidden_axis,
+            'yaxis': dict(hidden_axis),
+            'annotations': [{
+                'x': 0.5, 'y': 0.5,
+                'text': message,
+                'showarrow': False,
+                'font': dict(size=16, color=color)
+            }]
+        }
+    }
+
+@st.cache_data(show_spinner=False)
+def create_match_chart(similarity_score: float) -> go.Figure:
+    """
+    Create a gauge chart showing the match score.
     
-    return fig
+    Args:
+        similarity_score: Similarity score (0-100)
+        
+    Returns:
+        Plotly figure object
+    """
+    # Clone the static spec and splice in the two dynamic values; the
+    # shared band table picks the bar color branchlessly
+    payload = copy.deepcopy(_MATCH_TEMPLATE)
+    trace = payload['data'][0]
+    trace['value'] = similarity_score
+    trace['gauge']['bar']['color'] = _SCORE_COLORS[
+        int(np.digitize(similarity_score, _SCORE_EDGES))
+    ]
 
+    return go.Figure(payload, skip_invalid=True)
+
+@st.cache_data(show_spinner=False)
 def create_skills_radar_chart(resume_skills: List[str], job_skills: List[str], 
                             matched_skills: List[str]) -> go.Figure:
     """
@@ -67,87 +225,81 @@ def create_skills_radar_chart(resume_skills: List[str], job_skills: List[str],
     Returns:
         Plotly figure object
     """
-    # Categorize skills for radar chart
-    skill_categories = {
-        'Programming': ['python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby'],
-        'Web Technologies': ['html', 'css', 'react', 'angular', 'vue', 'node.js'],
-        'Databases': ['sql', 'mysql', 'postgresql', 'mongodb', 'oracle'],
-        'Cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes'],
-        'Data Science': ['machine learning', 'data analysis', 'pandas', 'numpy'],
-        'Tools': ['git', 'linux', 'jira', 'jenkins']
-    }
-    
-    # Calculate scores for each category
-    categories = []
-    resume_scores = []
-    job_scores = []
-    match_scores = []
-    
-    for category, category_skills in skill_categories.items():
-        categories.append(category)
-        
-        # Count skills in each category
-        resume_count = sum(1 for skill in resume_skills 
-                          if any(cat_skill in skill.lower() for cat_skill in category_skills))
-        job_count = sum(1 for skill in job_skills 
-                       if any(cat_skill in skill.lower() for cat_skill in category_skills))
-        match_count = sum(1 for skill in matched_skills 
-                         if any(cat_skill in skill.lower() for cat_skill in category_skills))
-        
-        # Convert to scores (normalize by maximum possible)
-        max_possible = max(len(category_skills), max(resume_count, job_count, 1))
-        
-        resume_scores.append((resume_count / max_possible) * 100)
-        job_scores.append((job_count / max_possible) * 100)
-        match_scores.append((match_count / max_possible) * 100)
-    
-    # Create radar chart
-    fig = go.Figure()
-    
-    # Add resume skills trace
-    fig.add_trace(go.Scatterpolar(
-        r=resume_scores,
-        theta=categories,
-        fill='toself',
-        name='Resume Skills',
-        line_color='blue',
-        fillcolor='rgba(0, 100, 255, 0.1)'
-    ))
-    
-    # Add job requirements trace
-    fig.add_trace(go.Scatterpolar(
-        r=job_scores,
-        theta=categories,
-        fill='toself',
-        name='Job Requirements',
-        line_color='red',
-        fillcolor='rgba(255, 0, 0, 0.1)'
-    ))
-    
-    # Add matched skills trace
-    fig.add_trace(go.Scatterpolar(
-        r=match_scores,
-        theta=categories,
-        fill='toself',
-        name='Matched Skills',
-        line_color='green',
-        fillcolor='rgba(0, 255, 0, 0.2)'
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100]
+    # Lowercase each input list once; the category loop reuses them and
+    # other charts rendering the same lists hit the memoized result
+    resume_low = _lower_tuple(tuple(resume_skills))
+    job_low = _lower_tuple(tuple(job_skills))
+    matched_low = _lower_tuple(tuple(matched_skills))
+
+    # All three lists are counted through the same membership matrix
+    # product, then normalized category-wise in one vectorized step
+    categories = list(_SKILL_CATEGORIES)
+    resume_counts = _category_counts(resume_low)
+    job_counts = _category_counts(job_low)
+    match_counts = _category_counts(matched_low)
+
+    max_possible = np.maximum.reduce(
+        [_CATEGORY_SIZES, resume_counts, job_counts,
+         np.ones_like(_CATEGORY_SIZES)]
+    )
+
+    # float32 is plenty of precision for chart coordinates and halves
+    # the payload Streamlit serializes to the browser
+    resume_scores = (resume_counts / max_possible * 100).astype(np.float32)
+    job_scores = (job_counts / max_possible * 100).astype(np.float32)
+    match_scores = (match_counts / max_possible * 100).astype(np.float32)
+    
+    # Close each polygon up front (first point repeated at the end) so
+    # the renderer does not rewrite the trace arrays to close the fill,
+    # and draw lines only — the filled outline never showed markers
+    theta_closed = categories + [categories[0]]
+
+    # Build the three traces and the layout in a single constructor call
+    # so Plotly validates them as one batch instead of per add_trace
+    return go.Figure(
+        data=[
+            go.Scatterpolar(
+                r=np.append(resume_scores, resume_scores[:1]),
+                theta=theta_closed,
+                mode='lines',
+                fill='toself',
+                name='Resume Skills',
+                line_color='blue',
+                fillcolor='rgba(0, 100, 255, 0.1)'
+            ),
+            go.Scatterpolar(
+                r=np.append(job_scores, job_scores[:1]),
+                theta=theta_closed,
+                mode='lines',
+                fill='toself',
+                name='Job Requirements',
+                line_color='red',
+                fillcolor='rgba(255, 0, 0, 0.1)'
+            ),
+            go.Scatterpolar(
+                r=np.append(match_scores, match_scores[:1]),
+                theta=theta_closed,
+                mode='lines',
+                fill='toself',
+                name='Matched Skills',
+                line_color='green',
+                fillcolor='rgba(0, 255, 0, 0.2)'
             )
-        ),
-        showlegend=True,
-        title="Skills Coverage by Category",
-        height=500
+        ],
+        layout=dict(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 100]
+                )
+            ),
+            showlegend=True,
+            title="Skills Coverage by Category",
+            height=500
+        )
     )
-    
-    return fig
 
+@st.cache_data(show_spinner=False)
 def create_comparison_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create a horizontal bar chart comparing multiple resumes.
@@ -160,49 +312,69 @@ def create_comparison_chart(df: pd.DataFrame) -> go.Figure:
     """
     # Sort by similarity score
     df_sorted = df.sort_values('similarity_score', ascending=True)
-    
-    # Create color scale based on scores
-    colors = []
-    for score in df_sorted['similarity_score']:
-        if score >= 80:
-            colors.append('green')
-        elif score >= 60:
-            colors.append('orange')
-        else:
-            colors.append('red')
-    
-    # Create horizontal bar chart
-    fig = go.Figure(go.Bar(
-        x=df_sorted['similarity_score'],
-        y=df_sorted['filename'],
-        orientation='h',
-        marker_color=colors,
-        text=[f"{score:.1f}%" for score in df_sorted['similarity_score']],
-        textposition='auto',
-        hovertemplate='<b>%{y}</b><br>' +
-                      'Match Score: %{x:.1f}%<br>' +
-                      '<extra></extra>'
-    ))
-    
-    fig.update_layout(
-        title="Resume Match Comparison",
-        xaxis_title="Match Score (%)",
-        yaxis_title="Resume Files",
-        height=max(400, len(df) * 50),
-        showlegend=False,
-        margin=dict(l=200, r=50, t=50, b=50)
+
+    # Very large batches would freeze the browser regardless of renderer;
+    # chart only the strongest matches and note the cut. The full ranking
+    # stays available in the results table
+    total_rows = len(df_sorted)
+    if total_rows > _MAX_CHART_ROWS:
+        df_sorted = df_sorted.tail(_MAX_CHART_ROWS)
+    
+    # Colors and labels built with vectorized operations instead of
+    # walking the Series row by row in Python
+    scores = df_sorted['similarity_score'].to_numpy(dtype=np.float32)
+    colors = _SCORE_COLORS[np.digitize(scores, _SCORE_EDGES)]
+    text = np.char.add(np.char.mod('%.1f', scores), '%')
+
+    if len(df_sorted) > _WEBGL_ROW_THRESHOLD:
+        # Large batches: SVG bars create one DOM node per row and bog the
+        # browser down; WebGL markers render the same ranking without the
+        # DOM bloat
+        trace = go.Scattergl(
+            x=scores,
+            y=df_sorted['filename'],
+            mode='markers',
+            marker=dict(color=colors, size=12, symbol='line-ns',
+                        line=dict(width=3, color=colors)),
+            hovertemplate='<b>%{y}</b><br>' +
+                          'Match Score: %{x:.1f}%<br>' +
+                          '<extra></extra>'
+        )
+    else:
+        # Small batches keep the SVG bar chart for visual fidelity
+        trace = go.Bar(
+            x=scores,
+            y=df_sorted['filename'],
+            orientation='h',
+            marker_color=colors,
+            text=text,
+            textposition='auto',
+            hovertemplate='<b>%{y}</b><br>' +
+                          'Match Score: %{x:.1f}%<br>' +
+                          '<extra></extra>'
+        )
+
+    title = "Resume Match Comparison"
+    if total_rows > _MAX_CHART_ROWS:
+        title += f" (top {_MAX_CHART_ROWS} of {total_rows})"
+
+    # Trace, layout, and the prebuilt guide lines assembled in a single
+    # constructor call
+    return go.Figure(
+        data=[trace],
+        layout=dict(
+            title=title,
+            xaxis_title="Match Score (%)",
+            yaxis_title="Resume Files",
+            height=max(400, len(df_sorted) * 50),
+            showlegend=False,
+            margin=dict(l=200, r=50, t=50, b=50),
+            shapes=_SCORE_GUIDES['shapes'],
+            annotations=_SCORE_GUIDES['annotations']
+        )
     )
-    
-    # Add vertical lines for score ranges
-    fig.add_vline(x=50, line_dash="dash", line_color="gray", 
-                  annotation_text="Minimum", annotation_position="top")
-    fig.add_vline(x=70, line_dash="dash", line_color="orange", 
-                  annotation_text="Good", annotation_position="top")
-    fig.add_vline(x=90, line_dash="dash", line_color="green", 
-                  annotation_text="Excellent", annotation_position="top")
-    
-    return fig
 
+@st.cache_data(show_spinner=False)
 def create_skills_distribution_chart(categorized_skills: Dict[str, List[str]]) -> go.Figure:
     """
     Create a pie chart showing distribution of skills by category.
@@ -223,39 +395,28 @@ def create_skills_distribution_chart(categorized_skills: Dict[str, List[str]]) -
             counts.append(len(skills))
     
     if not categories:
-        # Create empty chart if no skills
-        fig = go.Figure()
-        fig.add_annotation(
-            x=0.5, y=0.5,
-            text="No skills categorized",
-            showarrow=False,
-            font=dict(size=16)
+        return go.Figure(
+            _empty_figure("Skills Distribution", "No skills categorized",
+                          height=400)
         )
-        fig.update_layout(
-            title="Skills Distribution",
+    
+    # Pie trace and layout validated in one constructor call
+    return go.Figure(
+        data=[go.Pie(
+            labels=categories,
+            values=counts,
+            hole=0.3,
+            textinfo='label+percent',
+            textposition='auto'
+        )],
+        layout=dict(
+            title="Skills Distribution by Category",
             height=400,
-            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+            showlegend=True
         )
-        return fig
-    
-    # Create pie chart
-    fig = go.Figure(data=[go.Pie(
-        labels=categories,
-        values=counts,
-        hole=0.3,
-        textinfo='label+percent',
-        textposition='auto'
-    )])
-    
-    fig.update_layout(
-        title="Skills Distribution by Category",
-        height=400,
-        showlegend=True
     )
-    
-    return fig
 
+@st.cache_data(show_spinner=False)
 def create_skills_match_breakdown(matched_skills: List[str], missing_skills: List[str]) -> go.Figure:
     """
     Create a stacked bar chart showing matched vs missing skills breakdown.
@@ -271,23 +432,24 @@ def create_skills_match_breakdown(matched_skills: List[str], missing_skills: Lis
     matched_count = len(matched_skills)
     missing_count = len(missing_skills)
     
-    fig = go.Figure(data=[
-        go.Bar(name='Matched Skills', x=categories, y=[matched_count], 
-               marker_color='green', text=[f"{matched_count}"], textposition='auto'),
-        go.Bar(name='Missing Skills', x=categories, y=[missing_count], 
-               marker_color='red', text=[f"{missing_count}"], textposition='auto')
-    ])
-    
-    fig.update_layout(
-        barmode='stack',
-        title='Skills Match Breakdown',
-        yaxis_title='Number of Skills',
-        height=300,
-        showlegend=True
+    # Traces and layout validated in one constructor call
+    return go.Figure(
+        data=[
+            go.Bar(name='Matched Skills', x=categories, y=[matched_count], 
+                   marker_color='green', text=[f"{matched_count}"], textposition='auto'),
+            go.Bar(name='Missing Skills', x=categories, y=[missing_count], 
+                   marker_color='red', text=[f"{missing_count}"], textposition='auto')
+        ],
+        layout=dict(
+            barmode='stack',
+            title='Skills Match Breakdown',
+            yaxis_title='Number of Skills',
+            height=300,
+            showlegend=True
+        )
     )
-    
-    return fig
 
+@st.cache_data(show_spinner=False)
 def create_improvement_priority_chart(missing_skills: List[str], skill_importance: Dict[str, int] = None) -> go.Figure:
     """
     Create a chart showing improvement priorities for missing skills.
@@ -300,60 +462,50 @@ def create_improvement_priority_chart(missing_skills: List[str], skill_importanc
         Plotly figure object
     """
     if not missing_skills:
-        fig = go.Figure()
-        fig.add_annotation(
-            x=0.5, y=0.5,
-            text="No missing skills identified",
-            showarrow=False,
-            font=dict(size=16, color="green")
-        )
-        fig.update_layout(
-            title="Improvement Priorities",
-            height=300,
-            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+        return go.Figure(
+            _empty_figure("Improvement Priorities",
+                          "No missing skills identified", color='green')
         )
-        return fig
-    
-    # Assign importance scores if not provided
-    if not skill_importance:
-        skill_importance = {}
-        high_priority_keywords = ['python', 'java', 'sql', 'machine learning', 'aws', 'react']
-        
-        for skill in missing_skills:
-            if any(keyword in skill.lower() for keyword in high_priority_keywords):
-                skill_importance[skill] = 3  # High priority
-            else:
-                skill_importance[skill] = 2  # Medium priority
-    
-    # Sort skills by importance
-    sorted_skills = sorted(missing_skills, 
-                          key=lambda x: skill_importance.get(x, 1), 
-                          reverse=True)
-    
-    # Limit to top 10 for readability
-    top_skills = sorted_skills[:10]
-    priorities = [skill_importance.get(skill, 1) for skill in top_skills]
-    
-    # Create horizontal bar chart
-    colors = ['red' if p == 3 else 'orange' if p == 2 else 'yellow' for p in priorities]
-    
-    fig = go.Figure(go.Bar(
-        y=top_skills,
-        x=priorities,
-        orientation='h',
-        marker_color=colors,
-        text=['High' if p == 3 else 'Medium' if p == 2 else 'Low' for p in priorities],
-        textposition='auto'
-    ))
     
-    fig.update_layout(
-        title="Missing Skills - Learning Priority",
-        xaxis_title="Priority Level",
-        yaxis_title="Skills",
-        height=max(300, len(top_skills) * 30),
-        showlegend=False,
-        margin=dict(l=150, r=50, t=50, b=50)
+    # Assign importance scores as one int8 array: a single regex probe
+    # per skill when no explicit importance is given
+    if skill_importance:
+        priorities = np.array(
+            [skill_importance.get(skill, 1) for skill in missing_skills],
+            dtype=np.int8
+        )
+    else:
+        priorities = np.where(
+            [bool(_HIGH_PRIO_RE.search(skill))
+             for skill in _lower_tuple(tuple(missing_skills))],
+            3, 2
+        ).astype(np.int8)
+
+    # Top 10 for readability; the stable sort keeps the original order
+    # within equal priorities, matching the old sorted() behavior
+    top_idx = np.argsort(-priorities, kind='stable')[:10]
+    top_skills = [missing_skills[i] for i in top_idx]
+    # skill_importance is caller-supplied, so clamp to the 1-3 range the
+    # color/label tables are indexed by before using the values
+    top_priorities = np.clip(priorities[top_idx], 1, 3)
+
+    # Colors and labels come from the priority-indexed tables; trace and
+    # layout are validated together in one constructor call
+    return go.Figure(
+        data=[go.Bar(
+            y=top_skills,
+            x=top_priorities,
+            orientation='h',
+            marker_color=_PRIORITY_COLORS[top_priorities - 1],
+            text=_PRIORITY_LABELS[top_priorities - 1],
+            textposition='auto'
+        )],
+        layout=dict(
+            title="Missing Skills - Learning Priority",
+            xaxis_title="Priority Level",
+            yaxis_title="Skills",
+            height=max(300, len(top_skills) * 30),
+            showlegend=False,
+            margin=dict(l=150, r=50, t=50, b=50)
+        )
     )
-    
-    return fig